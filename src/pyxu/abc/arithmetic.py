@@ -116,11 +116,11 @@ class ScaleRule(Rule):
         self._cst = float(cst)
 
     def op(self) -> pxt.OpT:
-        if np.isclose(self._cst, 0):
+        if pxu._isclose(self._cst, 0):
             from pyxu.operator.linop import NullOp
 
             op = NullOp(shape=self._op.shape).squeeze()
-        elif np.isclose(self._cst, 1):
+        elif pxu._isclose(self._cst, 1):
             op = self._op
         else:
             klass = self._infer_op_klass()
@@ -156,7 +156,7 @@ class ScaleRule(Rule):
             }
         if self._op.has(pxo.Property.LINEAR):
             preserved.add(pxo.Property.PROXIMABLE)
-        if np.isclose(self._cst, -1):
+        if pxu._isclose(self._cst, -1):
             preserved.add(pxo.Property.LINEAR_UNITARY)
 
         properties = self._op.properties() & preserved
@@ -312,7 +312,7 @@ class ArgScaleRule(Rule):
         self._cst = float(cst)
 
     def op(self) -> pxt.OpT:
-        if np.isclose(self._cst, 0):
+        if pxu._isclose(self._cst, 0):
             # ConstantVECTOR output: modify ConstantValued to work.
             from pyxu.operator.map import ConstantValued
 
@@ -331,7 +331,7 @@ class ArgScaleRule(Rule):
                 cst=self._cst,
             )
             op.apply = types.MethodType(op_apply, op)
-        elif np.isclose(self._cst, 1):
+        elif pxu._isclose(self._cst, 1):
             op = self._op
         else:
             klass = self._infer_op_klass()
@@ -363,7 +363,7 @@ class ArgScaleRule(Rule):
         }
         if self._cst > 0:
             preserved.add(pxo.Property.LINEAR_POSITIVE_DEFINITE)
-        if np.isclose(self._cst, -1):
+        if pxu._isclose(self._cst, -1):
             preserved.add(pxo.Property.LINEAR_UNITARY)
 
         properties = self._op.properties() & preserved
@@ -532,7 +532,7 @@ class ArgShiftRule(Rule):
         kwargs = dict(fallback=np if self._scalar else None)
         xp = pxu.get_array_module(self._cst, **kwargs)
         norm = pxu.compute(xp.linalg.norm(self._cst))
-        if np.isclose(float(norm), 0):
+        if pxu._isclose(norm, 0):
             op = self._op
         else:
             klass = self._infer_op_klass()
@@ -1,8 +1,10 @@
 import typing as typ
 
+import numba
 import numpy as np
 
 import pyxu.abc.operator as pxo
+import pyxu.info.deps as pxd
 import pyxu.info.ptype as pxt
 import pyxu.util as pxu
 
@@ -14,7 +16,7 @@ class SquaredL2Norm(pxo.DiffFunc):
 
     def apply(self, arr: pxt.NDArray) -> pxt.Real:
         xp = pxu.get_array_module(arr)
-        return xp.linalg.norm(arr, axis=-1, keepdims=True) ** 2
+        return xp.einsum("...i,...i->...", arr, arr)[..., None]
 
     def grad(self, arr: pxt.NDArray) -> pxt.NDArray:
         return 2 * arr
@@ -31,7 +33,88 @@ class L1Norm(pxo.ProxFunc):
 
     def prox(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
         xp = pxu.get_array_module(arr)
-        return (abs(arr) - tau).clip(0, None) * xp.sign(arr)
+        y = xp.fabs(arr)
+        y -= tau
+        xp.fmax(y, 0, out=y)
+        xp.copysign(y, arr, out=y)
+        return y
+
+
+# FirstDerivative CPU kernels ---------------------------------------------------
+# All kernels share the signature (a, inv_h, edge, y), where a/y are (B, N) arrays holding B
+# independent signals, with N >= 2. Each output row is produced in a single streamed pass.
+#
+# Kernels are compiled lazily, for FP32/FP64 inputs only.
+_KERNEL_DTYPES = (np.dtype(np.float32), np.dtype(np.float64))
+
+
+@numba.njit(parallel=True, fastmath=True, nogil=True)
+def _fwd_apply(a, inv_h, edge, y):
+    B, N = a.shape
+    for b in numba.prange(B):
+        for i in range(N - 1):
+            y[b, i] = inv_h * (a[b, i + 1] - a[b, i])
+        y[b, N - 1] = 0
+
+
+@numba.njit(parallel=True, fastmath=True, nogil=True)
+def _fwd_adjoint(a, inv_h, edge, y):
+    B, N = a.shape
+    for b in numba.prange(B):
+        y[b, 0] = -inv_h * a[b, 0]
+        for i in range(1, N - 1):
+            y[b, i] = inv_h * (a[b, i - 1] - a[b, i])
+        y[b, N - 1] = inv_h * a[b, N - 2]
+
+
+@numba.njit(parallel=True, fastmath=True, nogil=True)
+def _bwd_apply(a, inv_h, edge, y):
+    B, N = a.shape
+    for b in numba.prange(B):
+        y[b, 0] = 0
+        for i in range(1, N):
+            y[b, i] = inv_h * (a[b, i] - a[b, i - 1])
+
+
+@numba.njit(parallel=True, fastmath=True, nogil=True)
+def _bwd_adjoint(a, inv_h, edge, y):
+    B, N = a.shape
+    for b in numba.prange(B):
+        y[b, 0] = -inv_h * a[b, 1]
+        for i in range(1, N - 1):
+            y[b, i] = inv_h * (a[b, i] - a[b, i + 1])
+        y[b, N - 1] = inv_h * a[b, N - 1]
+
+
+@numba.njit(parallel=True, fastmath=True, nogil=True)
+def _ctr_apply(a, inv_h, edge, y):
+    B, N = a.shape
+    for b in numba.prange(B):
+        for i in range(1, N - 1):
+            y[b, i] = (0.5 * inv_h) * (a[b, i + 1] - a[b, i - 1])
+        if edge:
+            y[b, 0] = inv_h * (a[b, 1] - a[b, 0])
+            y[b, N - 1] = inv_h * (a[b, N - 1] - a[b, N - 2])
+        else:
+            y[b, 0] = 0
+            y[b, N - 1] = 0
+
+
+@numba.njit(parallel=True, fastmath=True, nogil=True)
+def _ctr_adjoint(a, inv_h, edge, y):
+    B, N = a.shape
+    for b in numba.prange(B):
+        for i in range(N):
+            y[b, i] = 0
+        for i in range(1, N - 1):
+            v = (0.5 * inv_h) * a[b, i]
+            y[b, i - 1] -= v
+            y[b, i + 1] += v
+        if edge:
+            y[b, 0] -= inv_h * a[b, 0]
+            y[b, 1] += inv_h * a[b, 0]
+            y[b, N - 2] -= inv_h * a[b, N - 1]
+            y[b, N - 1] += inv_h * a[b, N - 1]
 
 
 class FirstDerivative(pxo.LinOp):
@@ -41,6 +124,8 @@ class FirstDerivative(pxo.LinOp):
         self.sampling = sampling
         self.edge = edge
         self.kind = kind
+        self._inv_sampling = 1.0 / sampling
+        self._inv_sampling_f32 = np.float32(self._inv_sampling)
 
         # choose apply and adjoint kind
         if kind == "forward":
@@ -55,58 +140,143 @@ class FirstDerivative(pxo.LinOp):
         else:
             raise NotImplementedError("kind must be forward, centered, " "or backward")
 
-    def _apply_forward(self, arr: pxt.NDArray) -> pxt.NDArray:
+    def _to_last(self, arr: pxt.NDArray) -> pxt.NDArray:
+        # Move `self.axis` to the last position. (No-op if it already is.)
+        #
+        # Slicing arithmetic along a strided last axis makes every ufunc stride-copy its operands,
+        # hence the result is made contiguous once here instead.
+        if self.axis in (-1, arr.ndim - 1):
+            return arr
         xp = pxu.get_array_module(arr)
-        arr = xp.swapaxes(arr, self.axis, -1)
-        y = xp.zeros_like(arr)
-        y[..., :-1] = (arr[..., 1:] - arr[..., :-1]) / self.sampling
-        return y
+        x = xp.moveaxis(arr, self.axis, -1)
+        if getattr(x, "strides", None) and (x.strides[-1] != x.itemsize):
+            x = xp.ascontiguousarray(x)
+        return x
 
-    def _adjoint_forward(self, arr: pxt.NDArray) -> pxt.NDArray:
+    def _from_last(self, arr: pxt.NDArray) -> pxt.NDArray:
+        # Inverse of _to_last().
+        if self.axis in (-1, arr.ndim - 1):
+            return arr
         xp = pxu.get_array_module(arr)
-        arr = xp.swapaxes(arr, self.axis, -1)
-        y = xp.zeros_like(arr)
-        y[..., :-1] -= arr[..., :-1] / self.sampling
-        y[..., 1:] += arr[..., :-1] / self.sampling
-        return y
+        return xp.moveaxis(arr, -1, self.axis)
+
+    def _scale(self, arr: pxt.NDArray) -> pxt.Real:
+        # 1/sampling at the precision of `arr`, so FP32 inputs stay in FP32 end-to-end.
+        if arr.dtype == np.float32:
+            return self._inv_sampling_f32
+        return self._inv_sampling
+
+    @staticmethod
+    def _jit_ok(arr: pxt.NDArray) -> bool:
+        # JIT kernels only exist for FP32/FP64 NUMPY inputs.
+        ndi = pxd.NDArrayInfo.from_obj(arr)
+        return (ndi == pxd.NDArrayInfo.NUMPY) and (arr.dtype in _KERNEL_DTYPES)
+
+    def _jit(self, kernel: typ.Callable, x: pxt.NDArray) -> pxt.NDArray:
+        # Evaluate a JIT-compiled kernel on NUMPY inputs, viewed as a (B, N) stack of signals.
+        # (`x` is given in _to_last() form.)
+        sh = x.shape
+        x = np.ascontiguousarray(x).reshape(-1, sh[-1])
+        y = np.empty_like(x)
+        kernel(x, self._scale(x), self.edge, y)
+        return self._from_last(y.reshape(sh))
+
+    @staticmethod
+    def _zeros(x: pxt.NDArray) -> pxt.NDArray:
+        # Output buffer for the stencils below: finite differences of integer inputs are floats, so
+        # they cannot be accumulated in-place into an integer buffer.
+        xp = pxu.get_array_module(x)
+        if np.issubdtype(x.dtype, np.inexact):
+            dtype = x.dtype
+        else:
+            dtype = np.float64
+        return xp.zeros_like(x, dtype=dtype)
+
+    def _null(self, x: pxt.NDArray) -> pxt.NDArray:
+        # No finite differences exist along singleton axes: the operator (and its adjoint) is 0.
+        # (`x` is given in _to_last() form.)
+        return self._from_last(self._zeros(x))
+
+    # FP32/FP64 NUMPY inputs are processed by the kernels above, which assume N >= 2.
+    # Other inputs (CUPY, DASK, ...) use the stencils below: plain slice assignments, as ufunc
+    # `out=` targets are not views for DASK inputs.
+
+    def _apply_forward(self, arr: pxt.NDArray) -> pxt.NDArray:
+        x = self._to_last(arr)
+        if x.shape[-1] < 2:
+            return self._null(x)
+        if self._jit_ok(x):
+            return self._jit(_fwd_apply, x)
+        y = self._zeros(x)
+        y[..., :-1] = x[..., 1:] - x[..., :-1]
+        y *= self._scale(y)
+        return self._from_last(y)
+
+    def _adjoint_forward(self, arr: pxt.NDArray) -> pxt.NDArray:
+        x = self._to_last(arr)
+        if x.shape[-1] < 2:
+            return self._null(x)
+        if self._jit_ok(x):
+            return self._jit(_fwd_adjoint, x)
+        y = self._zeros(x)
+        y[..., :-1] -= x[..., :-1]
+        y[..., 1:] += x[..., :-1]
+        y *= self._scale(y)
+        return self._from_last(y)
 
     def _apply_centered(self, arr: pxt.NDArray) -> pxt.NDArray:
-        xp = pxu.get_array_module(arr)
-        arr = xp.swapaxes(arr, self.axis, -1)
-        y = xp.zeros_like(arr)
-        y[..., 1:-1] = 0.5 * (arr[..., 2:] - arr[..., :-2]) / self.sampling
+        x = self._to_last(arr)
+        if x.shape[-1] < 2:
+            return self._null(x)
+        if self._jit_ok(x):
+            return self._jit(_ctr_apply, x)
+        y = self._zeros(x)
+        y[..., 1:-1] = 0.5 * (x[..., 2:] - x[..., :-2])
         if self.edge:
-            y[..., 0] = (arr[..., 1] - arr[..., 0]) / self.sampling
-            y[..., 0] = (arr[..., -1] - arr[..., -2]) / self.sampling
-        return y
+            y[..., :1] = x[..., 1:2] - x[..., :1]
+            y[..., -1:] = x[..., -1:] - x[..., -2:-1]
+        y *= self._scale(y)
+        return self._from_last(y)
 
     def _adjoint_centered(self, arr: pxt.NDArray) -> pxt.NDArray:
-        xp = pxu.get_array_module(arr)
-        arr = xp.swapaxes(arr, self.axis, -1)
-        y = xp.zeros_like(arr)
-        y[..., :-2] -= 0.5 * arr[..., 1:-1] / self.sampling
-        y[..., 2:] += 0.5 * arr[..., 1:-1] / self.sampling
+        x = self._to_last(arr)
+        if x.shape[-1] < 2:
+            return self._null(x)
+        if self._jit_ok(x):
+            return self._jit(_ctr_adjoint, x)
+        y = self._zeros(x)
+        y[..., :-2] -= 0.5 * x[..., 1:-1]
+        y[..., 2:] += 0.5 * x[..., 1:-1]
         if self.edge:
-            y[..., 0] -= arr[..., 0] / self.sampling
-            y[..., 1] += arr[..., 0] / self.sampling
-            y[..., -2] -= arr[..., -1] / self.sampling
-            y[..., -1] += arr[..., -1] / self.sampling
-        return y
+            y[..., :1] -= x[..., :1]
+            y[..., 1:2] += x[..., :1]
+            y[..., -2:-1] -= x[..., -1:]
+            y[..., -1:] += x[..., -1:]
+        y *= self._scale(y)
+        return self._from_last(y)
 
     def _apply_backward(self, arr: pxt.NDArray) -> pxt.NDArray:
-        xp = pxu.get_array_module(arr)
-        arr = xp.swapaxes(arr, self.axis, -1)
-        y = xp.zeros_like(arr)
-        y[..., 1:] = (arr[..., 1:] - arr[..., :-1]) / self.sampling
-        return y
+        x = self._to_last(arr)
+        if x.shape[-1] < 2:
+            return self._null(x)
+        if self._jit_ok(x):
+            return self._jit(_bwd_apply, x)
+        y = self._zeros(x)
+        y[..., 1:] = x[..., 1:] - x[..., :-1]
+        y *= self._scale(y)
+        return self._from_last(y)
 
     def _adjoint_backward(self, arr: pxt.NDArray) -> pxt.NDArray:
-        xp = pxu.get_array_module(arr)
-        arr = xp.swapaxes(arr, self.axis, -1)
-        y = xp.zeros_like(arr)
-        y[..., :-1] -= arr[..., 1:] / self.sampling
-        y[..., 1:] += arr[..., 1:] / self.sampling
-        return y
+        x = self._to_last(arr)
+        if x.shape[-1] < 2:
+            return self._null(x)
+        if self._jit_ok(x):
+            return self._jit(_bwd_adjoint, x)
+        y = self._zeros(x)
+        y[..., :-1] -= x[..., 1:]
+        y[..., 1:] += x[..., 1:]
+        y *= self._scale(y)
+        return self._from_last(y)
 
 
 class Masking(pxo.LinOp):
@@ -116,21 +286,27 @@ class Masking(pxo.LinOp):
         else:
             xp = pxu.get_array_module(sampling_bool)
 
-        self.sampling_bool = xp.asarray(sampling_bool).reshape(-1).astype(bool)
+        self.sampling_bool = xp.asarray(sampling_bool).reshape(-1)
+        if self.sampling_bool.dtype != bool:
+            self.sampling_bool = self.sampling_bool.astype(bool)
         self.input_size = size
-        self.nb_of_samples = self.sampling_bool[self.sampling_bool == True].size
+        self.nb_of_samples = int(xp.count_nonzero(self.sampling_bool))
         if self.sampling_bool.size != size:
             raise ValueError("Invalid size of boolean sampling array.")
         super(Masking, self).__init__(shape=(self.nb_of_samples, self.input_size))
 
+        # Integer indices of retained samples: avoids re-scanning the boolean mask at each call.
+        self._idx = xp.flatnonzero(self.sampling_bool).astype(xp.intp)
+
     def apply(self, arr: pxt.NDArray) -> pxt.NDArray:
-        return arr[..., self.sampling_bool]
+        xp = pxu.get_array_module(arr)
+        return xp.take(arr, self._idx, axis=-1)
 
     def adjoint(self, arr: pxt.NDArray) -> pxt.NDArray:
         xp = pxu.get_array_module(arr)
         arr = arr.reshape(1, -1) if (arr.ndim == 1) else arr
         y = xp.zeros((*arr.shape[:-1], self.input_size), dtype=arr.dtype)
-        y[..., self.sampling_bool] = arr
+        y[..., self._idx] = arr
         return y
 
 
@@ -161,46 +337,48 @@ class DownSampling(Masking):
         self.input_size = size
         self.input_shape = shape
         self.axis = axis
-        self.downsampling_mask = self.compute_downsampling_mask()
+
+        # Downsampling is a strided view of the input: no boolean mask is needed.
         if self.input_shape is None:
-            self.output_shape = None
+            self._arg_shape = (size,)
+            self._slices = (slice(None, None, self.downsampling_factor[0]),)
+        elif self.axis is None:
+            self._arg_shape = tuple(self.input_shape)
+            self._slices = tuple(slice(None, None, f) for f in self.downsampling_factor)
         else:
-            if len(self.downsampling_factor) > 1:
-                output_shape = []
-                for ax in range(len(self.input_shape)):
-                    axis_indices = np.arange(self.input_shape[ax])
-                    downsampled_axis_indices = axis_indices % self.downsampling_factor[ax]
-                    output_shape.append(downsampled_axis_indices[downsampled_axis_indices == 0].size)
-                self.output_shape = tuple(output_shape)
-            else:
-                output_shape = list(self.input_shape)
-                downsampled_axis_indices = np.arange(self.input_shape[self.axis])
-                downsampled_axis_indices = downsampled_axis_indices % self.downsampling_factor
-                output_shape[self.axis] = downsampled_axis_indices[downsampled_axis_indices == 0].size
-                self.output_shape = tuple(output_shape)
+            self._arg_shape = tuple(self.input_shape)
+            self._slices = [slice(None)] * len(self._arg_shape)
+            self._slices[self.axis] = slice(None, None, self.downsampling_factor[0])
+            self._slices = tuple(self._slices)
+        self._sub_shape = np.broadcast_to(0, self._arg_shape)[self._slices].shape
+        self.output_shape = None if (self.input_shape is None) else self._sub_shape
+        self.nb_of_samples = int(np.prod(self._sub_shape))
+
+        pxo.LinOp.__init__(self, shape=(self.nb_of_samples, self.input_size))
+
+    @property
+    def sampling_bool(self) -> np.ndarray:
+        return self.compute_downsampling_mask()
 
-        super(DownSampling, self).__init__(size=self.input_size, sampling_bool=self.downsampling_mask)
+    @property
+    def downsampling_mask(self) -> np.ndarray:
+        return self.compute_downsampling_mask()
 
     def compute_downsampling_mask(self) -> np.ndarray:
-        if self.input_shape is None:
-            indices = np.arange(self.input_size)
-            downsampled_mask = (indices % self.downsampling_factor) == 0
-        else:
-            if len(self.downsampling_factor) > 1:
-                downsampled_mask = True
-                for ax in range(len(self.input_shape)):
-                    axis_indices = np.arange(self.input_shape[ax])
-                    downsampled_axis_indices = axis_indices % self.downsampling_factor[ax]
-                    downsampled_axis_indices = downsampled_axis_indices.reshape(
-                        downsampled_axis_indices.shape + (len(self.input_shape) - 1) * (1,)
-                    )
-                    downsampled_axis_indices = np.swapaxes(downsampled_axis_indices, 0, ax)
-                    downsampled_mask = downsampled_mask * (downsampled_axis_indices == 0)
-            else:
-                downsampled_mask = np.zeros(shape=self.input_shape, dtype=bool)
-                downsampled_mask = np.swapaxes(downsampled_mask, 0, self.axis)
-                downsampled_axis_indices = np.arange(self.input_shape[self.axis])
-                downsampled_axis_indices = downsampled_axis_indices % self.downsampling_factor
-                downsampled_mask[downsampled_axis_indices == 0, ...] = True
-                downsampled_mask = np.swapaxes(downsampled_mask, 0, self.axis)
+        downsampled_mask = np.zeros(self._arg_shape, dtype=bool)
+        downsampled_mask[self._slices] = True
         return downsampled_mask.reshape(-1)
+
+    def apply(self, arr: pxt.NDArray) -> pxt.NDArray:
+        sh = arr.shape[:-1]
+        arr = arr.reshape(*sh, *self._arg_shape)
+        y = arr[(..., *self._slices)]
+        return y.reshape(*sh, -1)
+
+    def adjoint(self, arr: pxt.NDArray) -> pxt.NDArray:
+        xp = pxu.get_array_module(arr)
+        arr = arr.reshape(1, -1) if (arr.ndim == 1) else arr
+        sh = arr.shape[:-1]
+        y = xp.zeros((*sh, *self._arg_shape), dtype=arr.dtype)
+        y[(..., *self._slices)] = arr.reshape(*sh, *self._sub_shape)
+        return y.reshape(*sh, -1)
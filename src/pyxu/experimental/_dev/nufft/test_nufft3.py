@@ -8,10 +8,12 @@ import pyxu.util as pxu
 
 # client = distributed.Client(processes=False)
 use_dask = True
+xp = da if use_dask else np
 
 
 def NUFFT3_array(x, z, isign) -> np.ndarray:
-    return np.exp(1j * np.sign(isign) * z @ x.T)
+    _xp = pxu.get_array_module(x)
+    return _xp.exp(1j * np.sign(isign) * z @ x.T)
 
 
 rng = np.random.default_rng(0)
@@ -30,7 +32,7 @@ with pxrt.Precision(pxrt.Width.DOUBLE):
         real=False,
         debug=2,
     )
-    B = NUFFT3_array(x, z, isign)
+    B = NUFFT3_array(xp.asarray(x), xp.asarray(z), isign)  # lazy if use_dask
 
     arr = rng.normal(size=(2, 3, 4, M))
     arr = arr + 1j * rng.normal(size=arr.shape)
@@ -38,12 +40,13 @@ with pxrt.Precision(pxrt.Width.DOUBLE):
         arr = da.array(arr)
 
     A_out_fw = pxu.view_as_complex(A.apply(pxu.view_as_real(arr)))
-    B_out_fw = np.tensordot(arr.compute() if use_dask else arr, B, axes=[[-1], [-1]])
+    B_out_fw = xp.tensordot(arr, B, axes=[[-1], [-1]])
 
     A_out_bw = pxu.view_as_complex(A.adjoint(pxu.view_as_real(A_out_fw)))
-    B_out_bw = np.tensordot(B_out_fw, B.conj().T, axes=[[-1], [-1]])
+    B_out_bw = xp.tensordot(B_out_fw, B.conj().T, axes=[[-1], [-1]])
 
-    res_fw = (np.linalg.norm(A_out_fw - B_out_fw, axis=-1) / np.linalg.norm(B_out_fw, axis=-1)).max()
-    res_bw = (np.linalg.norm(A_out_bw - B_out_bw, axis=-1) / np.linalg.norm(B_out_bw, axis=-1)).max()
+    res_fw = (xp.linalg.norm(A_out_fw - B_out_fw, axis=-1) / xp.linalg.norm(B_out_fw, axis=-1)).max()
+    res_bw = (xp.linalg.norm(A_out_bw - B_out_bw, axis=-1) / xp.linalg.norm(B_out_bw, axis=-1)).max()
+    res_fw, res_bw = pxu.compute(res_fw, res_bw)
     print(float(res_fw))
     print(float(res_bw))
@@ -1,12 +1,11 @@
-import warnings
+import collections.abc as cabc
 
+import numba
 import numpy as np
-import scipy.optimize as sopt
 
 import pyxu.abc as pxa
 import pyxu.info.deps as pxd
 import pyxu.info.ptype as pxt
-import pyxu.info.warning as pxw
 import pyxu.math.linalg as pxlg
 import pyxu.runtime as pxrt
 import pyxu.util as pxu
@@ -41,14 +40,20 @@ class L1Norm(_ShiftLossMixin, pxa.ProxFunc):
 
     @pxrt.enforce_precision(i="arr")
     def apply(self, arr: pxt.NDArray) -> pxt.NDArray:
-        y = pxlg.norm(arr, ord=1, axis=-1, keepdims=True)
+        xp = pxu.get_array_module(arr)
+        y = xp.fabs(arr).sum(axis=-1, keepdims=True)
         return y
 
     @pxrt.enforce_precision(i=("arr", "tau"))
     def prox(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
         xp = pxu.get_array_module(arr)
-        y = xp.fmax(0, xp.fabs(arr) - tau)
-        y *= xp.sign(arr)
+
+        # Inplace implementation of
+        #     y = sign(arr) * fmax(0, |arr| - tau)
+        y = xp.fabs(arr)
+        y -= tau
+        xp.fmax(y, 0, out=y)
+        xp.copysign(y, arr, out=y)
         return y
 
 
@@ -70,10 +75,10 @@ class L2Norm(_ShiftLossMixin, pxa.ProxFunc):
     @pxrt.enforce_precision(i=("arr", "tau"))
     def prox(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
         xp = pxu.get_array_module(arr)
-        scale = 1 - tau / xp.fmax(self.apply(arr), tau)
+        n = xp.sqrt(xp.einsum("...i,...i->...", arr, arr))[..., np.newaxis]
+        scale = 1 - tau / xp.fmax(n, tau)
 
-        y = arr.copy()
-        y *= scale.astype(dtype=arr.dtype)
+        y = arr * scale.astype(dtype=arr.dtype)  # single output allocation: no copy() + scale
         return y
 
 
@@ -89,9 +94,9 @@ class SquaredL2Norm(pxa.QuadraticFunc):
 
     @pxrt.enforce_precision(i="arr")
     def apply(self, arr: pxt.NDArray) -> pxt.NDArray:
-        y = pxlg.norm(arr, axis=-1, keepdims=True)
-        y **= 2
-        return y
+        xp = pxu.get_array_module(arr)
+        y = xp.einsum("...i,...i->...", arr, arr)  # sum-of-squares: avoids sqrt() + square()
+        return y[..., np.newaxis]
 
     @pxrt.enforce_precision(i="arr")
     def grad(self, arr: pxt.NDArray) -> pxt.NDArray:
@@ -99,8 +104,7 @@ class SquaredL2Norm(pxa.QuadraticFunc):
 
     @pxrt.enforce_precision(i=("arr", "tau"))
     def prox(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
-        y = arr.copy()
-        y /= 2 * tau + 1
+        y = arr * (1 / (2 * tau + 1))  # single pass: no copy() + in-place divide
         return y
 
     def _quad_spec(self):
@@ -112,6 +116,35 @@ class SquaredL2Norm(pxa.QuadraticFunc):
         return (Q, c, t)
 
 
+@numba.njit(parallel=True, fastmath=True, nogil=True)
+def _prox_root_NUMPY(arr, tau, out):
+    # JIT-compiled SquaredL1Norm._prox_root() applied to each row of `arr`.
+    #
+    # arr, out: (N_stack, N)
+    N_stack, N = arr.shape
+    for k in numba.prange(N_stack):
+        a = arr[k]
+        y = np.sort(np.abs(a))[::-1]
+
+        if y[0] == 0:
+            out[k, :] = a
+        else:
+            # Part 1: Compute c = sqrt(tau / \mu_opt)
+            c, S = 0.0, 0.0
+            for i in range(N):
+                S += y[i]
+                c_i = (1 + 2 * tau * (i + 1)) / S
+                if y[i] * c_i > 2 * tau:
+                    c = c_i
+
+            # Part 2+3: Compute \lambda, then \prox
+            #     lambda_ = clip(|a| * c - 2 * tau, 0, None)
+            #     out = a * lambda_ / (lambda_ + 2 * tau)
+            for i in range(N):
+                lambda_ = max(abs(a[i]) * c - 2 * tau, 0.0)
+                out[k, i] = a[i] * lambda_ / (lambda_ + 2 * tau)
+
+
 class SquaredL1Norm(_ShiftLossMixin, pxa.ProxFunc):
     r"""
     :math:`\ell^{2}_{1}`-norm, :math:`\Vert\mathbf{x}\Vert^{2}_{1} := (\sum_{i=1}^{N} |x_{i}|)^{2}`.
@@ -127,12 +160,6 @@ class SquaredL1Norm(_ShiftLossMixin, pxa.ProxFunc):
 
             * 'root' uses [FirstOrd]_ Lemma 6.70,
             * 'sort' uses [OnKerLearn]_ Algorithm 2 (faster).
-
-        Notes
-        -----
-        Calling :py:meth:`~pyxu.operator.func.norm.SquaredL1Norm.prox` with DASK inputs when
-        `algo="sort"` is inefficient at scale.
-        Prefer `algo="root"` in this case.
         """
         super().__init__(shape=(1, dim))
         self.lipschitz = np.inf
@@ -140,103 +167,167 @@ class SquaredL1Norm(_ShiftLossMixin, pxa.ProxFunc):
         algo = prox_algo.strip().lower()
         assert algo in ("root", "sort")
         self._algo = algo
+        self._taps_cache = dict()  # (NDArrayInfo, dtype) -> [1, ..., N]
+        self._sort_K = min(dim, 64)  # entries sorted up-front by _prox_sort()
 
     @pxrt.enforce_precision(i="arr")
     def apply(self, arr: pxt.NDArray) -> pxt.NDArray:
-        y = pxlg.norm(arr, ord=1, axis=-1, keepdims=True)
-        y **= 2
+        xp = pxu.get_array_module(arr)
+        y = xp.fabs(arr).sum(axis=-1, keepdims=True)
+        y *= y
         return y
 
     def _prox_root(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
+        # Processes all stacked inputs at once. (NUMPY/CUPY inputs only.)
+        # NUMPY inputs are best handled by _prox_root_NUMPY(): this variant exists to keep CUPY
+        # inputs on-device, without per-row host synchronization.
         xp = pxu.get_array_module(arr)
-        norm = xp.linalg.norm(arr, axis=-1)
-        if not (norm > 0):
-            out = arr
-        else:
-            # Part 1: Compute \mu_opt -----------------------------------------
-            def f(mu: pxt.Real) -> pxt.Real:
-                # Proxy function to compute \mu_opt
-                #
-                # Inplace implementation of
-                #     f(mu) = clip(|arr| * sqrt(tau / mu) - 2 * tau, 0, None).sum() - 1
-                x = xp.fabs(arr)
-                x *= xp.sqrt(tau / mu)
-                x -= 2 * tau
-                xp.clip(x, 0, None, out=x)
-                y = x.sum()
-                y -= 1
-                return y
-
-            mu_opt, res = sopt.brentq(
-                f=f,
-                a=1e-12,
-                b=xp.fabs(arr).max() ** 2 / (4 * tau),
-                full_output=True,
-                disp=False,
-            )
-            if not res.converged:
-                msg = "Computing mu_opt did not converge."
-                raise ValueError(msg)
-
-            # Part 2: Compute \lambda -----------------------------------------
-            # Inplace implementation of
-            #     lambda_ = clip(|arr| * sqrt(tau / mu_opt) - 2 * tau, 0, None)
-            lambda_ = xp.fabs(arr)
-            lambda_ *= xp.sqrt(tau / mu_opt)
-            lambda_ -= 2 * tau
-            xp.clip(lambda_, 0, None, out=lambda_)
-
-            # Part 3: Compute \prox -------------------------------------------
-            # Inplace implementation of
-            #     out = arr * lambda_ / (lambda_ + 2 * tau)
-            out = arr.copy()
-            out *= lambda_
-            lambda_ += 2 * tau
-            out /= lambda_
-        return out
+        sh, N = arr.shape, arr.shape[-1]
+        arr = arr.reshape(-1, N)
+
+        # Part 1: Compute c = sqrt(tau / \mu_opt) -----------------------------
+        # f(mu) = clip(|arr| * sqrt(tau / mu) - 2 * tau, 0, None).sum() - 1 is monotone, and
+        # linear in sqrt(tau / mu) once the set of active (i.e. unclipped) entries is known.
+        # Active entries are the k largest |arr[i]|: walking them in decreasing order gives the
+        # root of f() in closed form.
+        #
+        # Inplace implementation of
+        #     y = sort(|arr|, axis=-1)[:, ::-1]
+        #     c = (1 + 2 * tau * [1, ..., N]) / y.cumsum(axis=-1)
+        #     c_opt = c[last index where (y * c > 2 * tau)]
+        y = xp.fabs(arr)
+        y.sort(axis=-1)
+        y = y[:, ::-1]
+        c = y.cumsum(axis=-1)
+        c[c == 0] = 1  # all-0 rows: any finite `c` yields prox(0) = 0
+        xp.divide(1 + 2 * tau * self._taps(c), c, out=c)
+
+        mask = y * c > 2 * tau
+        p = (N - 1) - xp.argmax(mask[:, ::-1], axis=-1)
+        c_opt = xp.take_along_axis(c, p[:, np.newaxis], axis=-1)
+
+        # Part 2: Compute \lambda ---------------------------------------------
+        # Inplace implementation of
+        #     lambda_ = clip(|arr| * c_opt - 2 * tau, 0, None)
+        lambda_ = xp.fabs(arr)
+        lambda_ *= c_opt
+        lambda_ -= 2 * tau
+        xp.clip(lambda_, 0, None, out=lambda_)
+
+        # Part 3: Compute \prox -----------------------------------------------
+        # Inplace implementation of
+        #     out = arr * lambda_ / (lambda_ + 2 * tau)
+        out = arr * lambda_
+        lambda_ += 2 * tau
+        out /= lambda_
+        return out.reshape(sh)
+
+    def _taps(self, arr: pxt.NDArray) -> pxt.NDArray:
+        # [1, ..., N] with the backend/precision of `arr`. (Cached: constant for a given `dim`.)
+        key = (pxd.NDArrayInfo.from_obj(arr), arr.dtype)
+        if (k := self._taps_cache.get(key)) is None:
+            xp = pxu.get_array_module(arr)
+            k = self._taps_cache[key] = xp.arange(1, self.dim + 1, dtype=arr.dtype)
+        return k
+
+    def _prox_root_NUMPY(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
+        # Processes all stacked inputs at once. (NUMPY inputs only.)
+        sh = arr.shape
+        arr = np.ascontiguousarray(arr.reshape(-1, sh[-1]))
+        out = np.empty_like(arr)
+        _prox_root_NUMPY(arr, float(tau), out)
+        return out.reshape(sh)
 
     def _prox_sort(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
+        # Processes all stacked inputs at once. (NUMPY/CUPY inputs only.)
         xp = pxu.get_array_module(arr)
+        sh, N = arr.shape, arr.shape[-1]
+        arr = arr.reshape(-1, N)
+        a = xp.fabs(arr)
+
+        # The threshold only depends on the largest entries of |arr| up to the crossover index.
+        # Solutions are typically sparse: start by sorting only the K largest entries of each row,
+        # and fall back to a full sort for rows whose crossover index may lie beyond K.
+        K = self._sort_K
+        if K < N:
+            y = xp.partition(a, kth=N - K, axis=-1)[:, N - K :]
+        else:
+            y = a.copy()
+        tau2, full = self._sort_threshold(y, tau)
+        if (K < N) and full.any():
+            idx = xp.flatnonzero(full)
+            tau2[idx], _ = self._sort_threshold(a[idx], tau)
 
         # Inplace implementation of
-        #     y = sort(|arr|, axis=-1)[::-1]
-        y = xp.fabs(arr)
+        #     out = sign(arr) * fmax(0, |arr| - tau2)
+        out = a
+        out -= tau2
+        xp.fmax(out, 0, out=out)
+        xp.copysign(out, arr, out=out)
+        return out.reshape(sh)
+
+    def _sort_threshold(self, y: pxt.NDArray, tau: pxt.Real) -> tuple[pxt.NDArray, pxt.NDArray]:
+        # Compute the soft-threshold of _prox_sort() from the K largest entries of |arr|.
+        #
+        # Parameters
+        # ----------
+        # y: NDArray
+        #     (N_stack, K) array holding the K largest entries of |arr| (in any order).
+        #     `y` is modified in-place.
+        #
+        # Returns
+        # -------
+        # tau2: NDArray
+        #     (N_stack, 1) soft-threshold.
+        # full: NDArray
+        #     (N_stack,) rows whose crossover index may lie beyond K.
+        xp = pxu.get_array_module(y)
+        K = y.shape[-1]
+
+        # Inplace implementation of
+        #     y = sort(y, axis=-1)[:, ::-1]
         y.sort(axis=-1)
-        y = y[::-1]
+        y = y[:, ::-1]
 
         z = y.cumsum(axis=-1)
-        z *= tau / (0.5 + tau * xp.arange(1, arr.size + 1, dtype=z.dtype))
-        tau2 = z[max(xp.flatnonzero(y > z), default=0)]
+        z *= tau / (0.5 + tau * self._taps(z)[:K])
 
-        out = L1Norm(dim=self.dim).prox(arr, tau2)
-        return out
+        # tau2 = z[last index where (y > z)], or z[0] if no such index exists.
+        mask = y > z
+        p = (K - 1) - xp.argmax(mask[:, ::-1], axis=-1)
+        p[~mask.any(axis=-1)] = 0
+        tau2 = xp.take_along_axis(z, p[:, np.newaxis], axis=-1)
+        return tau2, mask[:, -1]
 
     @pxrt.enforce_precision(i=("arr", "tau"))
     def prox(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
         N = pxd.NDArrayInfo
-        if (N.from_obj(arr) == N.DASK) and (self._algo == "sort"):
-            msg = "\n".join(
-                [
-                    "Using prox_algo='sort' on DASK inputs is inefficient.",
-                    "Consider using prox_algo='root' instead.",
-                ]
+        if N.from_obj(arr) == N.DASK:
+            # Rows are independent: process each chunk (holding entire rows) in parallel.
+            sh = arr.shape
+            x = arr.reshape(-1, sh[-1]).rechunk({1: -1})
+            out = x.map_blocks(
+                self._prox_func(x._meta),
+                tau,
+                dtype=arr.dtype,
+                meta=x._meta,
             )
-            warnings.warn(msg, pxw.PerformanceWarning)
-
-        vectorize = pxu.vectorize(
-            # DASK backend required since prox_[root|sort]() don't accept DASK inputs.
-            i="arr",
-            method="parallel",
-            codim=arr.shape[-1],
-        )
-        f = dict(
-            root=vectorize(self._prox_root),
-            sort=vectorize(self._prox_sort),
-        )[self._algo]
-
-        out = f(arr, tau)
+            out = out.reshape(sh)
+        else:
+            out = self._prox_func(arr)(arr, tau)
         return out
 
+    def _prox_func(self, arr: pxt.NDArray) -> cabc.Callable:
+        # Natively-vectorized prox() implementation for NUMPY/CUPY inputs.
+        N = pxd.NDArrayInfo
+        if self._algo == "sort":
+            f = self._prox_sort
+        elif N.from_obj(arr) == N.NUMPY:
+            f = self._prox_root_NUMPY
+        else:
+            f = self._prox_root
+        return f
+
 
 class LInfinityNorm(_ShiftLossMixin, pxa.ProxFunc):
     r"""
@@ -249,48 +340,56 @@ class LInfinityNorm(_ShiftLossMixin, pxa.ProxFunc):
 
     @pxrt.enforce_precision(i="arr")
     def apply(self, arr: pxt.NDArray) -> pxt.NDArray:
-        y = pxlg.norm(arr, ord=np.inf, axis=-1, keepdims=True)
+        xp = pxu.get_array_module(arr)
+        y = xp.fabs(arr).max(axis=-1, keepdims=True)
         return y
 
     @pxrt.enforce_precision(i=("arr", "tau"))
     def prox(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
-        vectorize = pxu.vectorize(
-            i="arr",
-            method="parallel",
-            codim=arr.shape[-1],
-        )
-        f = vectorize(self._prox)
+        N = pxd.NDArrayInfo
+        if N.from_obj(arr) == N.DASK:
+            vectorize = pxu.vectorize(
+                # DASK backend required since _prox() doesn't accept DASK inputs.
+                i="arr",
+                method="parallel",
+                codim=arr.shape[-1],
+            )
+            f = vectorize(self._prox)
+        else:
+            f = self._prox  # natively vectorized
 
         out = f(arr, tau)
         return out
 
     def _prox(self, arr: pxt.NDArray, tau: pxt.Real) -> pxt.NDArray:
+        # Processes all stacked inputs at once. (NUMPY/CUPY inputs only.)
+        #
+        # Moreau decomposition: prox_{tau f}(x) = x - proj_{tau B_{1}}(x) = clip(x, -mu, mu), where
+        # mu >= 0 solves clip(|x| - mu, 0, None).sum() = tau.
+        # mu is obtained in closed form from the sorted magnitudes of `x`. (Duchi et al., 2008)
         xp = pxu.get_array_module(arr)
-        y = xp.zeros(arr.shape, dtype=arr.dtype)
-
-        def f(mu: pxt.Real) -> pxt.Real:
-            # Proxy function to compute \mu_opt
-            #
-            # Inplace implementation of
-            #     f(mu) = clip(xp.fabs(arr) - mu, 0, None).sum() - tau
-            x = xp.fabs(arr)
-            x -= mu
-            xp.clip(x, 0, None, out=x)
-            y = x.sum()
-            y -= tau
-            return y
-
-        mu_max = self.apply(arr)
-        if (mu_max > 0).all():
-            mu_opt = sopt.brentq(f, a=0, b=mu_max)
-
-            # Inplace implementation of
-            #     y = sgn(arr) * fmin(|arr|, mu_opt)
-            xp.fabs(arr, out=y)
-            xp.fmin(y, mu_opt, out=y)
-            y *= xp.sign(arr)
+        sh, N = arr.shape, arr.shape[-1]
+        arr = arr.reshape(-1, N)
 
-        return y
+        # Inplace implementation of
+        #     y = sort(|arr|, axis=-1)[:, ::-1]
+        #     z = (y.cumsum(axis=-1) - tau) / [1, ..., N]
+        y = xp.fabs(arr)
+        y.sort(axis=-1)
+        y = y[:, ::-1]
+        z = y.cumsum(axis=-1)
+        z -= tau
+        z /= xp.arange(1, N + 1, dtype=z.dtype)
+
+        # mu = fmax(z[last index where (y > z)], 0)
+        # Note: (y > z) holds at index 0 since tau > 0.
+        mask = y > z
+        p = (N - 1) - xp.argmax(mask[:, ::-1], axis=-1)
+        mu = xp.take_along_axis(z, p[:, np.newaxis], axis=-1)
+        xp.fmax(mu, 0, out=mu)
+
+        out = xp.clip(arr, -mu, mu)
+        return out.reshape(sh)
 
 
 class L21Norm(_ShiftLossMixin, pxa.ProxFunc):
@@ -335,32 +434,40 @@ class L21Norm(_ShiftLossMixin, pxa.ProxFunc):
         self._l1_axis = l1_axis
         self._l2_axis = l2_axis
 
+        # Sum-of-squares over `l2_axis` is computed via einsum() to avoid materializing arr**2.
+        # [Ex: arg_shape=(A, B, C), l2_axis=(0, 2)] -> "...abc,...abc->...b"
+        idx = "".join(chr(ord("a") + d) for d in range(N_dim))
+        idx_l1 = "".join(idx[d] for d in l1_axis)
+        self._l2_sum = f"...{idx},...{idx}->...{idx_l1}"
+        self._l2_shape = tuple(1 if (d in l2_axis) else arg_shape[d] for d in range(N_dim))
+        self._l1_sum_axis = tuple(int(d) - N_dim for d in l1_axis)  # stack-agnostic
+
+    def _l2_norm(self, arr: pxt.NDArray) -> pxt.NDArray:
+        # arr: (..., *arg_shape)
+        # n: (..., *arg_shape) with `l2_axis` reduced to size 1.
+        xp = pxu.get_array_module(arr)
+        sh = arr.shape[: -len(self._arg_shape)]
+        n = xp.einsum(self._l2_sum, arr, arr).reshape(sh + self._l2_shape)
+        xp.sqrt(n, out=n)
+        return n
+
     @pxrt.enforce_precision(i="arr")
     def apply(self, arr: pxt.NDArray):
         sh = arr.shape[:-1]
         arr = arr.reshape(sh + self._arg_shape)
+        x = self._l2_norm(arr)
 
-        l2_axis = tuple(len(sh) + self._l2_axis)
-        x = (arr**2).sum(axis=l2_axis, keepdims=True)
-        xp = pxu.get_array_module(arr)
-        xp.sqrt(x, out=x)
-
-        l1_axis = tuple(len(sh) + self._l1_axis)
-        out = x.sum(axis=l1_axis, keepdims=True)
+        out = x.sum(axis=self._l1_sum_axis, keepdims=True)
         return out.reshape(*sh, -1)
 
     @pxrt.enforce_precision(i=("arr", "tau"))
     def prox(self, arr: pxt.NDArray, tau: pxt.Real):
         sh = arr.shape[:-1]
         arr = arr.reshape(sh + self._arg_shape)
+        n = self._l2_norm(arr)
 
-        l2_axis = tuple(len(sh) + self._l2_axis)
-        n = (arr**2).sum(axis=l2_axis, keepdims=True)
         xp = pxu.get_array_module(arr)
-        xp.sqrt(n, out=n)
-
-        out = arr.copy()
-        out *= 1 - tau / xp.fmax(n, tau)
+        out = arr * (1 - tau / xp.fmax(n, tau))  # single output allocation: no copy() + scale
         return out.reshape(*sh, -1)
 
 
@@ -3,6 +3,7 @@ import typing as typ
 import warnings
 
 import numpy as np
+import scipy.sparse as scisp
 
 import pyxu.abc as pxa
 import pyxu.info.deps as pxd
@@ -45,8 +46,10 @@ class IdentityOp(pxa.OrthProjOp):
 
     @pxrt.enforce_precision(i=("arr", "damp"))
     def pinv(self, arr: pxt.NDArray, damp: pxt.Real, **kwargs) -> pxt.NDArray:
-        out = arr.copy()
-        out /= 1 + damp
+        if damp == 0:  # common case: pinv() = apply()
+            out = pxu.read_only(arr)
+        else:
+            out = arr / (1 + damp)
         return out
 
     def dagger(self, damp: pxt.Real, **kwargs) -> pxt.OpT:
@@ -147,16 +150,15 @@ def HomothetyOp(dim: pxt.Integer, cst: pxt.Real) -> pxt.OpT:
     """
     assert isinstance(cst, pxt.Real), f"cst: expected real, got {cst}."
 
-    if np.isclose(cst, 0):
+    if pxu._isclose(cst, 0):
         op = NullOp(shape=(dim, dim))
-    elif np.isclose(cst, 1):
+    elif pxu._isclose(cst, 1):
         op = IdentityOp(dim=dim)
     else:  # build PosDef or SelfAdjointOp
 
         @pxrt.enforce_precision(i="arr")
         def op_apply(_, arr: pxt.NDArray) -> pxt.NDArray:
-            out = arr.copy()
-            out *= _._cst
+            out = arr * _._cst  # single pass: no copy() + in-place scale
             return out
 
         def op_svdvals(_, **kwargs) -> pxt.NDArray:
@@ -173,9 +175,8 @@ def HomothetyOp(dim: pxt.Integer, cst: pxt.Real) -> pxt.OpT:
 
         @pxrt.enforce_precision(i=("arr", "damp"))
         def op_pinv(_, arr: pxt.NDArray, damp: pxt.Real, **kwargs) -> pxt.NDArray:
-            out = arr.copy()
             scale = _._cst / (_._cst**2 + damp)
-            out *= scale
+            out = arr * scale
             return out
 
         def op_dagger(_, damp: pxt.Real, **kwargs) -> pxt.OpT:
@@ -237,9 +238,16 @@ def DiagonalOp(
         return HomothetyOp(cst=float(vec), dim=1)
     else:
         xp = pxu.get_array_module(vec)
-        if pxu.compute(xp.allclose(vec, 0)):
+        # All properties of `vec` are evaluated in one go: DASK inputs are then only computed once.
+        is_null, is_identity, is_posdef, vec_max = pxu.compute(
+            xp.allclose(vec, 0),
+            xp.allclose(vec, 1),
+            xp.all(vec > 0),
+            abs(vec).max(),
+        )
+        if is_null:
             op = NullOp(shape=(dim, dim))
-        elif pxu.compute(xp.allclose(vec, 1)):
+        elif is_identity:
             op = IdentityOp(dim=dim)
         else:  # build PosDef or SelfAdjointOp
 
@@ -248,8 +256,8 @@ def DiagonalOp(
                 if (_._vec.dtype != arr.dtype) and _._enable_warnings:
                     msg = "Computation may not be performed at the requested precision."
                     warnings.warn(msg, pxw.PrecisionWarning)
-                out = arr.copy()
-                out *= _._vec
+                # single pass: no copy() + in-place scale. (astype() is a no-op if precisions match.)
+                out = (arr * _._vec).astype(arr.dtype, copy=False)
                 return out
 
             def op_asarray(_, **kwargs) -> pxt.NDArray:
@@ -276,25 +284,33 @@ def DiagonalOp(
                 which = kwargs.get("which", "LM")
 
                 D = xp.abs(pxu.compute(_._vec))
-                D = D[xp.argsort(D)]
+                if k < D.size:  # O(N) selection of the k extremal values; only those get sorted.
+                    D = xp.partition(D, k - 1)[:k] if (which == "SM") else xp.partition(D, D.size - k)[-k:]
+                D = xp.sort(D)
                 D = D.astype(width.value, copy=False)
                 return D[:k] if (which == "SM") else D[-k:]
 
+            def _pinv_scale(vec: pxt.NDArray, damp: pxt.Real) -> pxt.NDArray:
+                # scale = vec / (vec**2 + damp), with 0/0 entries set to 0.
+                denom = vec * vec + damp
+                if pxd.NDArrayInfo.from_obj(vec) == pxd.NDArrayInfo.NUMPY:
+                    # NaN-free: 0/0 entries are skipped altogether
+                    scale = xp.zeros_like(vec, dtype=denom.dtype)
+                    xp.divide(vec, denom, out=scale, where=(denom != 0))
+                else:
+                    # CuPy/Dask ufuncs do not support `where=`: guard the denominator instead.
+                    null = denom == 0
+                    scale = xp.where(null, 0, vec / xp.where(null, 1, denom))
+                return scale
+
             @pxrt.enforce_precision(i=("arr", "damp"))
             def op_pinv(_, arr: pxt.NDArray, damp: pxt.Real, **kwargs) -> pxt.NDArray:
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    scale = _._vec / (_._vec**2 + damp)
-                    scale[xp.isnan(scale)] = 0
-                out = arr.copy()
-                out *= scale
+                scale = _pinv_scale(_._vec, damp)
+                out = (arr * scale).astype(arr.dtype, copy=False)
                 return out
 
             def op_dagger(_, damp: pxt.Real, **kwargs) -> pxt.OpT:
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore")
-                    scale = _._vec / (_._vec**2 + damp)
-                    scale[xp.isnan(scale)] = 0
+                scale = _pinv_scale(_._vec, damp)
                 return DiagonalOp(
                     vec=scale,
                     enable_warnings=_._enable_warnings,
@@ -310,7 +326,7 @@ def DiagonalOp(
                 return _._lipschitz
 
             op = pxsrc.from_source(
-                cls=pxa.PosDefOp if pxu.compute(xp.all(vec > 0)) else pxa.SelfAdjointOp,
+                cls=pxa.PosDefOp if is_posdef else pxa.SelfAdjointOp,
                 shape=(dim, dim),
                 embed=dict(
                     _name="DiagonalOp",
@@ -327,7 +343,7 @@ def DiagonalOp(
                 trace=op_trace,
             )
             op.dagger = types.MethodType(op_dagger, op)
-            op.lipschitz = float(abs(vec).max())
+            op.lipschitz = float(vec_max)
         return op.squeeze()
 
 
@@ -404,6 +420,14 @@ def _ExplicitLinOp(
         else:
             return A
 
+    def _compute_form(A):
+        # SciPy only provides batched (multi-vector) kernels for CSR/CSC matrices: other formats
+        # (COO, BSR, DIA, ...) evaluate stacked inputs one column at a time.
+        # These are converted once to CSR for apply/adjoint() purposes. (`.mat` is left as-is.)
+        if scisp.issparse(A) and (A.format not in ("csr", "csc")):
+            A = A.tocsr()
+        return A
+
     def _matmat(A, b, warn: bool) -> pxt.NDArray:
         # A: (M, N) dense/sparse
         # b: (..., N) dense
@@ -412,6 +436,9 @@ def _ExplicitLinOp(
             msg = "Computation may not be performed at the requested precision."
             warnings.warn(msg, pxw.PrecisionWarning)
 
+        if b.ndim == 1:  # matrix-vector product: no reshape/transpose needed
+            return A.dot(b)
+
         M, N = A.shape
         sh_out = (*b.shape[:-1], M)
         b = b.reshape((-1, N)).T  # (N, (...).prod)
@@ -420,11 +447,11 @@ def _ExplicitLinOp(
 
     @pxrt.enforce_precision(i="arr")
     def op_apply(_, arr: pxt.NDArray) -> pxt.NDArray:
-        return _matmat(_.mat, arr, warn=_._enable_warnings)
+        return _matmat(_._mat, arr, warn=_._enable_warnings)
 
     @pxrt.enforce_precision(i="arr")
     def op_adjoint(_, arr: pxt.NDArray) -> pxt.NDArray:
-        return _matmat(_.mat.T, arr, warn=_._enable_warnings)
+        return _matmat(_._mat.T, arr, warn=_._enable_warnings)
 
     def op_estimate_lipscthitz(_, **kwargs) -> pxt.Real:
         N = pxd.NDArrayInfo
@@ -495,12 +522,14 @@ def _ExplicitLinOp(
                     raise ValueError(f"Unknown sparse format {_.mat}.")
             return float(tr)
 
+    mat = _standard_form(mat)
     op = pxsrc.from_source(
         cls=cls,
         shape=mat.shape,
         embed=dict(
             _name="_ExplicitLinOp",
-            mat=_standard_form(mat),
+            mat=mat,
+            _mat=_compute_form(mat),
             _enable_warnings=bool(enable_warnings),
         ),
         apply=op_apply,
@@ -1,7 +1,7 @@
 import collections
 import collections.abc as cabc
+import functools
 import itertools
-import math
 import types
 import typing as typ
 
@@ -75,8 +75,8 @@ def _sanitize_init_kwargs(
     sampling = _ensure_tuple(sampling, param_name="sampling")
     if len(sampling) == 1:
         sampling = sampling * len(arg_shape)
-    assert all([_ >= 0 for _ in order]), "Order must be positive"
-    assert all([_ > 0 for _ in sampling]), "Sampling must be strictly positive"
+    assert all(_ >= 0 for _ in order), "Order must be positive"
+    assert all(_ > 0 for _ in sampling), "Sampling must be strictly positive"
 
     if diff_method == "fd":
         param1_name = "scheme"
@@ -95,11 +95,11 @@ def _sanitize_init_kwargs(
     _param2 = _ensure_tuple(param2, param_name=param2_name)
 
     if param1_name == "sigma":
-        assert all([p >= 0 for p in _param1]), "Sigma must be strictly positive"
+        assert all(p >= 0 for p in _param1), "Sigma must be strictly positive"
     if param2_name == "accuracy":
-        assert all([p >= 0 for p in _param2]), "Accuracy must be positive"
+        assert all(p >= 0 for p in _param2), "Accuracy must be positive"
     elif param2_name == "truncate":
-        assert all([p > 0 for p in _param2]), "Truncate must be strictly positive"
+        assert all(p > 0 for p in _param2), "Truncate must be strictly positive"
 
     if len(order) != len(arg_shape):
         assert axes is not None, (
@@ -112,7 +112,7 @@ def _sanitize_init_kwargs(
             axes = _ensure_tuple(axes, param_name="axes")
             assert len(axes) == len(order), "`axes` must have the same number of elements as `order`"
         else:
-            axes = tuple([i for i in range(len(arg_shape))])
+            axes = tuple(range(len(arg_shape)))
 
     if not (len(_param1) == len(order)):
         assert len(_param1) == 1, (
@@ -135,6 +135,57 @@ def _sanitize_init_kwargs(
     )
 
 
+# Kernel coefficients only depend on a few scalar parameters, but are re-computed per axis each time
+# a derivative operator is built. (Gradient, Hessian & co. build many of them.)
+# Cached arrays must not be modified in-place: callers receive copies.
+@functools.lru_cache(maxsize=256)
+def _fd_coefficients(
+    stencil_ids: tuple[pxt.Integer, ...],
+    order: pxt.Integer,
+    sampling: pxt.Real,
+    dtype: pxt.DType,
+) -> pxt.NDArray:
+    # Solution of the Vandermonde system described in PartialDerivative.finite_difference(), obtained in
+    # O(N_s^2) via Fornberg's recurrence (B. Fornberg, "Generation of Finite Difference Formulas on Arbitrarily
+    # Spaced Grids", Math. Comp. 51(184), 1988): numerically stabler than solving the system directly.
+    #
+    # c[j, k] = weight of x[j] in the k-th derivative approximation at 0, using nodes x[:i+1].
+    x = np.array(stencil_ids, dtype=np.double)
+    n = len(x)
+    c = np.zeros((n, order + 1), dtype=np.double)
+    c[0, 0] = 1
+    c1, c4 = 1.0, x[0]
+    for i in range(1, n):
+        mn = min(i, order)
+        c2, c5, c4 = 1.0, c4, x[i]
+        for j in range(i):
+            c3 = x[i] - x[j]
+            c2 *= c3
+            if j == i - 1:
+                for k in range(mn, 0, -1):
+                    c[i, k] = c1 * (k * c[i - 1, k - 1] - c5 * c[i - 1, k]) / c2
+                c[i, 0] = -c1 * c5 * c[i - 1, 0] / c2
+            for k in range(mn, 0, -1):
+                c[j, k] = (c4 * c[j, k] - k * c[j, k - 1]) / c3
+            c[j, 0] = c4 * c[j, 0] / c3
+        c1 = c2
+
+    coefs = c[:, order] / (sampling**order)
+    return coefs.astype(dtype)
+
+
+@functools.lru_cache(maxsize=256)
+def _gd_coefficients(
+    sigma: pxt.Real,
+    order: pxt.Integer,
+    sampling: pxt.Real,
+    radius: pxt.Integer,
+) -> pxt.NDArray:
+    # Flip + rescale in one pass: the result is a fresh C-contiguous array, not a negative-stride view.
+    coefs = np.flip(scif._gaussian_kernel1d(sigma, order, radius)) / (sampling**order)
+    return coefs
+
+
 def _create_kernel(
     arg_shape: pxt.NDArrayShape,
     axes: pxt.NDArrayAxis,
@@ -236,16 +287,13 @@ def _FiniteDifference(
         """
         Computes the finite difference coefficients based on the order and indices.
         """
-        # vander doesn't allow precision specification
-        stencil_mat = np.vander(
-            np.array(stencil_ids),
-            increasing=True,
-        ).T.astype(pxrt.getPrecision().value)
-        vec = np.zeros(len(stencil_ids), dtype=pxrt.getPrecision().value)
-        vec[order] = math.factorial(order)
-        coefs = np.linalg.solve(stencil_mat, vec)
-        coefs /= sampling**order
-        return coefs
+        coefs = _fd_coefficients(
+            stencil_ids=tuple(stencil_ids),
+            order=int(order),
+            sampling=float(sampling),
+            dtype=pxrt.getPrecision().value,
+        )
+        return coefs.copy()
 
     # FILL COEFFICIENTS
     def _fill_coefs(i: pxt.Integer) -> tuple[list[pxt.NDArray], pxt.Integer]:
@@ -340,9 +388,13 @@ def _GaussianDerivative(
         Wraps scipy.ndimage.filters._gaussian_kernel1d
         It flips the output because the original kernel is meant for convolution instead of correlation.
         """
-        coefs = np.flip(scif._gaussian_kernel1d(sigma, order, radius))
-        coefs /= sampling**order
-        return coefs
+        coefs = _gd_coefficients(
+            sigma=float(sigma),
+            order=int(order),
+            sampling=float(sampling),
+            radius=int(radius),
+        )
+        return coefs.copy()
 
     kernel, center = _create_kernel(arg_shape, axes, _fill_coefs)
     return kernel, center
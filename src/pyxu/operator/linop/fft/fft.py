@@ -1,3 +1,4 @@
+import contextlib
 import inspect
 
 import numpy as np
@@ -181,6 +182,12 @@ class FFT(pxa.LinOp):  # Inherits from LinOp instead of NormalOp since operator
             Supported parameters for :py:func:`scipy.fft.fftn` are:
 
                 * workers: int = 1
+                * backend: object = None
+
+                  :py:mod:`scipy.fft` backend used to compute transforms, e.g. ``mkl_fft._scipy_fft_backend`` from
+                  the optional `mkl_fft <https://github.com/IntelPython/mkl_fft>`_ package for SIMD-dispatched FFTs
+                  on Intel CPUs. (See :py:func:`scipy.fft.set_backend`.)
+                  If ``None``, the globally-active backend is used.
 
             Supported parameters for :py:func:`cupyx.scipy.fft.fftn` are:
 
@@ -207,6 +214,7 @@ class FFT(pxa.LinOp):  # Inherits from LinOp instead of NormalOp since operator
         self._kwargs = {
             pxd.NDArrayInfo.NUMPY: dict(
                 workers=kwargs.get("workers", 1),
+                backend=kwargs.get("backend", None),
             ),
             pxd.NDArrayInfo.CUPY: dict(),
         }
@@ -291,12 +299,19 @@ class FFT(pxa.LinOp):  # Inherits from LinOp instead of NormalOp since operator
         sig = inspect.Signature.from_callable(func)
         kwargs = {k: v for (k, v) in self._kwargs[ndi].items() if (k in sig.parameters)}
 
-        out = func(
-            x=arr,
-            axes=self._axes,
-            norm=norm,
-            **kwargs,
-        )
+        backend = self._kwargs[ndi].get("backend", None)
+        if backend is None:
+            ctx = contextlib.nullcontext()
+        else:
+            ctx = fft.set_backend(backend)
+
+        with ctx:
+            out = func(
+                x=arr,
+                axes=self._axes,
+                norm=norm,
+                **kwargs,
+            )
         return out
 
     @pxrt.enforce_precision(i="arr")
@@ -4,6 +4,8 @@ import itertools
 import pyxu.abc.operator as pxo
 import pyxu.info.deps as pxd
 import pyxu.info.ptype as pxt
+import pyxu.info.warning as pxw
+import pyxu.operator.interop.source as pxsrc
 import pyxu.operator.linop.base as pxlb
 import pyxu.operator.linop.diff as pxld
 import pyxu.operator.linop.pad as pxlp
@@ -18,6 +20,7 @@ except ImportError:
 
 import functools
 import typing as typ
+import warnings
 
 import numpy as np
 
@@ -25,6 +28,8 @@ IndexSpec = cabc.Sequence[pxt.Integer]
 KernelSpec = pxls.Stencil.KernelSpec
 ModeSpec = pxlp.Pad.ModeSpec
 
+_CUMSUM_MIN_SIZE = 8  # window size above which MovingAverage() switches to _BoxSum()
+
 
 __all__ = [
     "MovingAverage",
@@ -133,6 +138,10 @@ def MovingAverage(
         (See :py:func:`numpy.pad` for details.)
     gpu: bool
         Input NDArray type (`True` for GPU, `False` for CPU). Defaults to `False`.
+
+        Only used for windows of at most 8 elements per axis, evaluated via
+        :py:class:`~pyxu.operator.linop.stencil.stencil.Stencil`.
+        Wider windows are evaluated via prefix sums, which accept inputs of any array backend.
     dtype: DType
         Working precision of the linear operator.
 
@@ -176,14 +185,143 @@ def MovingAverage(
 
     ndim, dtype, xp = _sanitize_inputs(arg_shape, dtype, gpu)
 
-    kernel = [xp.ones(s, dtype=dtype) for s in size]  # use separable filters
     scale = 1 / np.prod(size)
-
-    op = scale * pxls.Stencil(arg_shape=arg_shape, kernel=kernel, center=center, mode=mode)
+    if max(size) > _CUMSUM_MIN_SIZE:
+        # O(N) prefix-sum evaluation beats the O(N * size) stencil for wide windows.
+        op = scale * _BoxSum(arg_shape=arg_shape, size=size, center=center, mode=mode, dtype=dtype)
+    else:
+        kernel = [xp.ones(s, dtype=dtype) for s in size]  # use separable filters
+        op = scale * pxls.Stencil(arg_shape=arg_shape, kernel=kernel, center=center, mode=mode)
     op._name = "MovingAverage"
     return op
 
 
+def _box_sum(
+    x: pxt.NDArray,
+    axis: pxt.Integer,
+    size: pxt.Integer,
+    center: pxt.Integer,
+    start: pxt.Integer,
+    length: pxt.Integer,
+) -> pxt.NDArray:
+    # Compute
+    #     y[..., k, ...] = \sum_{q=0}^{size-1} x[..., start + k - center + q, ...],  k \in [0, length),
+    # with zero boundary conditions, via differences of prefix sums.
+    #
+    # Prefix sums are accumulated in double precision to limit cancellation errors on large inputs.
+    xp = pxu.get_array_module(x)
+    n = x.shape[axis]
+    lo = start - center  # index of the 1st term in the 1st window
+    lhs = max(0, -lo)
+    rhs = max(0, lo + length + size - 1 - n)
+
+    # S[i] = x[..., :i - lhs, ...].sum(), for i in [0, n + lhs + rhs]
+    select = lambda a, b: S[(slice(None),) * axis + (slice(a, b),)]
+    if pxd.NDArrayInfo.from_obj(x) == pxd.NDArrayInfo.DASK:
+        S = xp.cumsum(x, axis=axis, dtype=np.float64)
+        pad_width = [(0, 0)] * x.ndim
+        pad_width[axis] = (lhs + 1, 0)
+        S = xp.pad(S, pad_width, mode="constant")
+        pad_width[axis] = (0, rhs)
+        S = xp.pad(S, pad_width, mode="edge")
+    else:  # fill a single buffer in-place rather than re-allocating it per xp.pad() call
+        sh = list(x.shape)
+        sh[axis] = n + lhs + 1 + rhs
+        S = xp.empty(sh, dtype=np.float64)
+        select(0, lhs + 1)[...] = 0
+        xp.cumsum(x, axis=axis, dtype=np.float64, out=select(lhs + 1, lhs + 1 + n))
+        select(lhs + 1 + n, None)[...] = select(lhs + n, lhs + 1 + n)
+
+    y = select(lo + lhs + size, lo + lhs + size + length) - select(lo + lhs, lo + lhs + length)
+    return y.astype(x.dtype, copy=False)
+
+
+def _BoxSum(
+    arg_shape: pxt.NDArrayShape,
+    size: cabc.Sequence[pxt.Integer],
+    center: IndexSpec,
+    mode: ModeSpec = "constant",
+    dtype: typ.Optional[pxt.DType] = None,
+) -> pxt.OpT:
+    # Un-normalized separable box filter, i.e. Stencil(kernel=[ones(s) for s in size]), evaluated in
+    # O(N) per axis using prefix sums.
+    #
+    # Boundary conditions other than zero-padding are obtained by pre-padding inputs such that each
+    # window is fully supported.
+    # As with Stencil(), computations are performed at precision `dtype`.
+    arg_shape = tuple(arg_shape)
+
+    # transform `mode` to canonical form tuple[str, ...]
+    if isinstance(mode, str):  # shared mode
+        mode = (mode,) * len(arg_shape)
+    assert len(mode) == len(arg_shape), "arg_shape/mode are length-mismatched."
+    _mode = tuple(map(lambda _: _.strip().lower(), mode))
+    assert set(_mode) <= {
+        "constant",
+        "wrap",
+        "reflect",
+        "symmetric",
+        "edge",
+    }, "Unknown mode(s) encountered."
+
+    pad_width, pad_mode = [], []
+    for s, c, m in zip(size, center, _mode):
+        p = 0 if (m == "constant") else max(c, s - c - 1)
+        pad_width.append((p, p))
+        pad_mode.append(m if (p > 0) else "constant")
+    pad = pxlp.Pad(arg_shape, pad_width=tuple(pad_width), mode=tuple(pad_mode))
+    if dtype is None:
+        dtype = pxrt.getPrecision().value
+
+    def _cast_warn(_, arr: pxt.NDArray) -> pxt.NDArray:
+        if arr.dtype == _._dtype:
+            out = arr
+        else:
+            msg = "Computation may not be performed at the requested precision."
+            warnings.warn(msg, pxw.PrecisionWarning)
+            out = arr.astype(dtype=_._dtype)
+        return out
+
+    @pxrt.enforce_precision(i="arr")
+    def op_apply(_, arr: pxt.NDArray) -> pxt.NDArray:
+        arr = _cast_warn(_, arr)
+        sh = arr.shape[:-1]
+        x = _._pad.apply(arr).reshape(*sh, *_._pad._pad_shape)
+        for d, (n, s, c, (lhs, _rhs)) in enumerate(zip(_._arg_shape, _._size, _._center, _._pad._pad_width)):
+            if s > 1:
+                x = _box_sum(x, axis=len(sh) + d, size=s, center=c, start=lhs, length=n)
+            else:  # trim only
+                x = x[(slice(None),) * (len(sh) + d) + (slice(lhs, lhs + n),)]
+        return x.reshape(*sh, -1)
+
+    @pxrt.enforce_precision(i="arr")
+    def op_adjoint(_, arr: pxt.NDArray) -> pxt.NDArray:
+        arr = _cast_warn(_, arr)
+        sh = arr.shape[:-1]
+        x = arr.reshape(*sh, *_._arg_shape)
+        for d, (n, s, c, (lhs, rhs)) in enumerate(zip(_._arg_shape, _._size, _._center, _._pad._pad_width)):
+            if s > 1:  # correlation with the flipped window, evaluated on the padded domain
+                x = _box_sum(x, axis=len(sh) + d, size=s, center=s - c - 1, start=-lhs, length=n + lhs + rhs)
+        return _._pad.adjoint(x.reshape(*sh, -1))
+
+    op = pxsrc.from_source(
+        cls=pxo.SquareOp,
+        shape=(pad.dim, pad.dim),
+        embed=dict(
+            _name="_BoxSum",
+            _arg_shape=arg_shape,
+            _size=tuple(size),
+            _center=tuple(center),
+            _pad=pad,
+            _dtype=np.dtype(dtype),
+        ),
+        apply=op_apply,
+        adjoint=op_adjoint,
+    )
+    op.lipschitz = np.prod(size) * pad.lipschitz  # Young's inequality: \norm{h}{1} = prod(size)
+    return op
+
+
 def Gaussian(
     arg_shape: pxt.NDArrayShape,
     sigma: typ.Union[typ.Tuple[pxt.Real], pxt.Real] = 1.0,
@@ -1,8 +1,10 @@
 import collections.abc as cabc
+import string
 
 import numpy as np
 
 import pyxu.abc as pxa
+import pyxu.info.deps as pxd
 import pyxu.info.ptype as pxt
 import pyxu.operator.interop.source as pxsrc
 import pyxu.runtime as pxrt
@@ -79,13 +81,22 @@ def Sum(
     sum_shape = arg_shape.copy()  # array shape after reduction
     sum_shape[axis] = 1
 
+    # einsum() subscripts of the reduction, with stack-dims absorbed by the ellipsis.
+    idx = list(string.ascii_letters[:N_dim])
+    sum_subscripts = "..." + "".join(idx) + "->..." + "".join(np.delete(idx, axis))
+
     @pxrt.enforce_precision(i="arr")
     def op_apply(_, arr: pxt.NDArray) -> pxt.NDArray:
         sh = arr.shape[:-1]
         arr = arr.reshape(sh + _._arg_shape)
 
-        axis = tuple(ax + len(sh) for ax in _._axis)
-        out = arr.sum(axis=axis).reshape(*sh, -1)
+        if pxd.NDArrayInfo.from_obj(arr) == pxd.NDArrayInfo.DASK:
+            axis = tuple(ax + len(sh) for ax in _._axis)
+            out = arr.sum(axis=axis)
+        else:  # single reduction kernel, without intermediate buffers
+            xp = pxu.get_array_module(arr)
+            out = xp.einsum(_._sum_subscripts, arr)
+        out = out.reshape(*sh, -1)
 
         return out
 
@@ -116,6 +127,7 @@ def Sum(
             _axis=tuple(axis),
             _arg_shape=tuple(arg_shape),
             _sum_shape=tuple(sum_shape),
+            _sum_subscripts=sum_subscripts,
         ),
         apply=op_apply,
         adjoint=op_adjoint,
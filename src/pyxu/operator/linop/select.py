@@ -109,6 +109,7 @@ class SubSample(pxa.LinOp):
                 idx = slice(idx, idx + 1)
             self._idx[i] = idx
         self._idx = tuple(self._idx)
+        self._selector = (Ellipsis, *self._idx)  # stack-agnostic form used in apply/adjoint()
 
         output = np.broadcast_to(0, self._arg_shape)[self._idx]
         self._sub_shape = np.atleast_1d(output).shape
@@ -134,8 +135,7 @@ class SubSample(pxa.LinOp):
         sh = arr.shape[:-1]
         arr = arr.reshape(*sh, *self._arg_shape)
 
-        selector = (*[slice(None) for dim in sh], *self._idx)
-        out = arr[selector].reshape(*sh, -1)
+        out = arr[self._selector].reshape(*sh, -1)
 
         out = pxu.read_only(out)
         return out
@@ -160,8 +160,7 @@ class SubSample(pxa.LinOp):
 
         xp = pxu.get_array_module(arr)
         out = xp.zeros((*sh, *self._arg_shape), dtype=arr.dtype)
-        selector = (*[slice(None) for dim in sh], *self._idx)
-        out[selector] = arr
+        out[self._selector] = arr
 
         out = out.reshape(*sh, -1)
         return out
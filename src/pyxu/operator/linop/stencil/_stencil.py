@@ -2,6 +2,7 @@
 Low-level functions used to define user-facing stencils.
 """
 import collections.abc as cabc
+import functools
 import itertools
 import string
 
@@ -12,6 +13,19 @@ import pyxu.info.ptype as pxt
 import pyxu.runtime as pxrt
 
 
+@functools.lru_cache(maxsize=128)
+def _compile(code: str) -> cabc.Callable:
+    # Execute code generated by _Stencil._gen_code() and return the `f_jit()` Dispatcher it defines.
+    #
+    # Generated code fully specifies the stencil (coefficients, center, signature): compiled
+    # Dispatchers are shared amongst identical stencils to avoid re-compilation.
+    # (Derivative operators re-create the same handful of kernels many times.)
+    # The cache is bounded since each distinct kernel (ex: one per Gaussian sigma) adds an entry.
+    namespace = dict()
+    exec(code, namespace)  # compile stencil
+    return namespace["f_jit"]
+
+
 def _signature(params, returns) -> str:
     # Translate a signature of the form
     #     [in_1_spec, ..., in_N_spec] -> out_spec
@@ -205,9 +219,7 @@ class _Stencil:
         self._kernel = kernel
         self._center = center
         self._code = self._gen_code()
-
-        exec(self._code, locals())  # compile stencil
-        self._dispatch = eval("f_jit")  # keep track of JIT Dispatcher
+        self._dispatch = _compile(self._code)  # keep track of JIT Dispatcher
 
     def _gen_code(self) -> str:
         # Generate code which creates `f_jit()` after execution.
@@ -399,8 +411,10 @@ def f_jit(arr, out):
             "blockspergrid",
         }
 
-        attr = self._kernel.device.attributes
-        tpb = kwargs.get("threadsperblock", attr["MaxThreadsPerBlock"])
+        if not hasattr(self, "_max_tpb"):  # device attributes are costly to query: do it once.
+            attr = self._kernel.device.attributes
+            self._max_tpb = attr["MaxThreadsPerBlock"]
+        tpb = kwargs.get("threadsperblock", self._max_tpb)
         bpg = kwargs.get("blockspergrid", (pb_size // tpb) + 1)
         return self._dispatch[bpg, tpb]
 
@@ -196,7 +196,7 @@ class Stencil(pxa.SquareOp):
          y = op.apply(x)  # [0  3  8  14  20  26  32  38  44  50]
 
 
-    * **Non-seperable image filtering**
+    * **Non-separable image filtering**
 
       Let :math:`x[n, m]` denote a 2D image.
       The blurred image
@@ -252,7 +252,7 @@ class Stencil(pxa.SquareOp):
          #  [408  720  734  748  762  776  790  340 ]
          #  [147  246  251  256  261  266  271  108 ]]
 
-    * **Seperable image filtering**
+    * **Separable image filtering**
 
       Let :math:`x[n, m]` denote a 2D image.
       The warped image
@@ -296,7 +296,7 @@ class Stencil(pxa.SquareOp):
          \end{array}
          \right].
 
-      Seperable stencils are supported and should be preferred when applicable.
+      Separable stencils are supported and should be preferred when applicable.
 
       .. code-block:: python3
 
@@ -313,7 +313,7 @@ class Stencil(pxa.SquareOp):
          #  [48  49  50  51  52  53  54  55]
          #  [56  57  58  59  60  61  62  63]]
 
-         op_2D = Stencil(  # using non-seperable kernel
+         op_2D = Stencil(  # using non-separable kernel
              arg_shape=x.shape,
              kernel=np.array(
                  [[ 4,  5,  6],
@@ -321,7 +321,7 @@ class Stencil(pxa.SquareOp):
                   [12, 15, 18]]),
              center=(1, 1),  # k[1, 1] applies on x[n, m]
          )
-         op_sep = Stencil(  # using seperable kernels
+         op_sep = Stencil(  # using separable kernels
              arg_shape=x.shape,
              kernel=[
                  np.array([1, 2, 3]),  # k1: stencil along 1st axis
@@ -349,8 +349,8 @@ class Stencil(pxa.SquareOp):
     """
 
     KernelSpec = typ.Union[
-        pxt.NDArray,  # (k1, ..., kD) non-seperable kernel
-        cabc.Sequence[pxt.NDArray],  # [(k1,), ..., (kD,)] seperable kernels
+        pxt.NDArray,  # (k1, ..., kD) non-separable kernel
+        cabc.Sequence[pxt.NDArray],  # [(k1,), ..., (kD,)] separable kernels
     ]
 
     def __init__(
@@ -370,7 +370,7 @@ class Stencil(pxa.SquareOp):
             Stencil coefficients.
             Two forms are accepted:
 
-            * NDArray of rank-:math:`D`: denotes a non-seperable stencil.
+            * NDArray of rank-:math:`D`: denotes a non-separable stencil.
             * tuple[NDArray_1, ..., NDArray_D]: a sequence of 1D stencils such that dimension[k]
               is filtered by stencil `kernel[k]`, that is:
 
@@ -404,6 +404,13 @@ class Stencil(pxa.SquareOp):
             If ``True``, emit a warning in case of precision mis-match issues.
         """
         arg_shape, _kernel, _center, _mode = self._canonical_repr(arg_shape, kernel, center, mode)
+
+        # Factored kernels only match the user-provided kernel up to round-off: the latter is kept
+        # to report .kernel, whereas the factors are only used to evaluate the stencil.
+        self._kernel_fw, self._kernel_bw = _kernel[0], self._bw_equivalent(_kernel, _center)[0][0]
+        _kernel, _center, self._factored = self._separate(_kernel, _center)
+        if not self._factored:
+            self._kernel_fw = self._kernel_bw = None
         codim = dim = np.prod(arg_shape)
         super().__init__(shape=(codim, dim))
 
@@ -418,6 +425,9 @@ class Stencil(pxa.SquareOp):
             arg_shape=self._pad._pad_shape,
             trim_width=pad_width,
         )
+        # Trim() equivalent for (N_stack, *pad_shape) arrays: used by .apply() to skip Trim.apply()'s
+        # reshape round-trip.
+        self._trim_select = (Ellipsis,) + tuple(slice(lhs, lhs + n) for (n, (lhs, _)) in zip(arg_shape, pad_width))
 
         # Stencil operators used in .apply()
         self._st_fw = [None] * len(_kernel)
@@ -430,6 +440,11 @@ class Stencil(pxa.SquareOp):
         for i, (k_bw, c_bw) in enumerate(zip(_kernel, _center)):
             self._st_bw[i] = _Stencil.init(kernel=k_bw, center=c_bw)
 
+        # Separable filters often hold unit 1-tap kernels along some axes (ex: partial derivatives):
+        # these are no-ops and are skipped when evaluating the stencil chain.
+        self._chain_fw = self._drop_identity(self._st_fw)
+        self._chain_bw = self._drop_identity(self._st_bw)
+
         self._dispatch_params = dict()  # Extra kwargs passed to _Stencil.apply()
         self._dtype = _kernel[0].dtype  # useful constant
         self._enable_warnings = bool(enable_warnings)
@@ -443,10 +458,9 @@ class Stencil(pxa.SquareOp):
         x = self._pad.apply(arr)
         x = x.reshape(-1, *self._pad._pad_shape)
 
-        y = self._stencil_chain(self._cast_warn(x), self._st_fw)
-        y = y.reshape(*arr.shape[:-1], -1)
+        y = self._stencil_chain(self._cast_warn(x), self._chain_fw)
 
-        out = self._trim.apply(y)
+        out = y[self._trim_select].reshape(*arr.shape[:-1], -1)
         return out
 
     @pxrt.enforce_precision(i="arr")
@@ -454,7 +468,7 @@ class Stencil(pxa.SquareOp):
         x = self._trim.adjoint(arr)
         x = x.reshape(-1, *self._pad._pad_shape)
 
-        y = self._stencil_chain(self._cast_warn(x), self._st_bw)
+        y = self._stencil_chain(self._cast_warn(x), self._chain_bw)
         y = y.reshape(*arr.shape[:-1], -1)
 
         out = self._pad.adjoint(y)
@@ -510,14 +524,14 @@ class Stencil(pxa.SquareOp):
 
         kernel = pxu.compute(kernel, traverse=True)
         try:
-            # array input -> non-seperable filter
+            # array input -> non-separable filter
             pxu.get_array_module(kernel)
             assert kernel.ndim == N
 
             _kernel = [pxrt.coerce(kernel)]
             _center = [np.array(center, dtype=int)]
         except Exception:
-            # sequence input -> seperable filter(s)
+            # sequence input -> separable filter(s)
             assert len(kernel) == N  # one filter per dimension
 
             _kernel = [None] * N
@@ -537,15 +551,51 @@ class Stencil(pxa.SquareOp):
 
         return arg_shape, _kernel, _center, _mode
 
+    @staticmethod
+    def _separate(_kernel, _center):
+        # Factor a non-separable kernel into D 1D kernels if it is an outer product (i.e. rank-1).
+        #
+        # Separable stencils cost O(\sum_{d} K_{d}) operations per sample instead of O(\prod_{d} K_{d}).
+        #
+        # Returns
+        # -------
+        # _kernel, _center: canonical representations as in _canonical_repr()
+        # factored: bool
+        #     True if the kernel was factored.
+        kernel = _kernel[0]
+        N, sh = kernel.ndim, kernel.shape
+        if (len(_kernel) > 1) or (sum(sh) >= np.prod(sh)):  # already separable, or nothing to gain
+            return _kernel, _center, False
+
+        xp = pxu.get_array_module(kernel)
+        factors, k = [], kernel
+        for i in range(N - 1):
+            U, S, Vh = xp.linalg.svd(k.reshape(sh[i], -1), full_matrices=False)
+            S = pxu.to_NUMPY(S)
+            tol = S[0] * max(U.shape[0], Vh.shape[1]) * np.finfo(kernel.dtype).eps  # same as np.linalg.matrix_rank()
+            if (S[0] == 0) or ((S.size > 1) and (S[1] > tol)):
+                return _kernel, _center, False
+            factors.append(U[:, 0] * S[0])
+            k = Vh[0]
+        factors.append(k)
+
+        for i in range(N):
+            sh = [1] * N
+            sh[i] = -1
+            factors[i] = factors[i].reshape(sh).astype(kernel.dtype, copy=False)
+        center = np.zeros((N, N), dtype=int)
+        center[np.diag_indices(N)] = _center[0]
+        return factors, center, True
+
     @staticmethod
     def _compute_pad_width(_kernel, _center, _mode) -> Pad.WidthSpec:
         N = _kernel[0].ndim
         pad_width = [None] * N
         for i in range(N):
-            if len(_kernel) == 1:  # non-seperable filter
+            if len(_kernel) == 1:  # non-separable filter
                 c = _center[0][i]
                 n = _kernel[0].shape[i]
-            else:  # seperable filter(s)
+            else:  # separable filter(s)
                 c = _center[i][i]
                 n = _kernel[i].size
 
@@ -560,14 +610,20 @@ class Stencil(pxa.SquareOp):
             pad_width[i] = (p, p)
         return tuple(pad_width)
 
+    @staticmethod
+    def _drop_identity(stencils: list) -> list:
+        # Remove (separable) stencils which leave their input unchanged, i.e. kernel = [1].
+        chain = [st for st in stencils if not ((st._kernel.size == 1) and (pxu.to_NUMPY(st._kernel).item() == 1))]
+        return chain
+
     @staticmethod
     def _bw_equivalent(_kernel, _center):
         # Transform FW kernel/center specification to BW variant.
         k_bw = [np.flip(k_fw) for k_fw in _kernel]
 
-        if len(_kernel) == 1:  # non-seperable filter
+        if len(_kernel) == 1:  # non-separable filter
             c_bw = [(_kernel[0].shape - _center[0]) - 1]
-        else:  # seperable filter(s)
+        else:  # separable filter(s)
             N = _kernel[0].ndim
             c_bw = np.zeros((N, N), dtype=int)
             for i in range(N):
@@ -584,15 +640,18 @@ class Stencil(pxa.SquareOp):
         # [2022.12.28, Sepand]
         #   For some unknown reason, .map_overlap() gives incorrect results when inputs to
         #   .map_overlap() contain stacking dimensions.
-        #   Workaround: call .map_overlap() on each stack-dim seperately, then re-assemble.
+        #   Workaround: call .map_overlap() on each stack-dim separately, then re-assemble.
 
         # _compute_pad_width(): LHS/RHS padded equally, so choose either one
         depth = [lhs for (lhs, rhs) in self._pad._pad_width]
+        #
+        # Boundary conditions are already baked into `x` by Pad(): no extra halo is needed at the
+        # array's outer edges. (Same behaviour as _stencil_chain() on NUMPY/CUPY inputs.)
         y = [
             _.map_overlap(
                 self._stencil_chain,
                 depth=depth,
-                boundary=0,
+                boundary="none",
                 trim=True,
                 dtype=x.dtype,
                 meta=x._meta,
@@ -662,13 +721,40 @@ class Stencil(pxa.SquareOp):
         return op
 
     def asarray(self, **kwargs) -> pxt.NDArray:
+        # Imprint kernel coefficients directly into the matrix rather than evaluating apply(eye(dim)).
+        #
+        # Boundary conditions are resolved by padding a map of (1-based) flat indices: Pad() only
+        # moves data around, so padded entries hold the index of the input sample they replicate,
+        # or 0 if zero-padded.
+        arg_shape = self._pad._arg_shape
+        with pxrt.Precision(pxrt.Width.DOUBLE):
+            idx = np.arange(1, self.dim + 1, dtype=np.double)
+            idx = self._pad.apply(idx).reshape(self._pad._pad_shape)
+        idx = np.rint(idx).astype(np.int64) - 1
+
         # Stencil.apply() prefers precision provided at init-time.
-        xp = pxu.get_array_module(self._st_fw[0]._kernel)
-        _A = super().asarray(xp=xp, dtype=self._dtype)
+        K = functools.reduce(operator.mul, [pxu.to_NUMPY(st._kernel) for st in self._st_fw], 1)
+        K = np.asarray(K, dtype=self._dtype)
+        center = np.array(self.center)
+
+        _A = np.zeros((self.codim, self.dim), dtype=self._dtype)
+        rows = np.arange(self.codim)
+        for m in zip(*np.nonzero(K)):
+            select = tuple(
+                slice(lhs + s, lhs + s + N)
+                for (s, N, (lhs, _)) in zip(
+                    np.array(m) - center,
+                    arg_shape,
+                    self._pad._pad_width,
+                )
+            )
+            cols = idx[select].reshape(-1)
+            valid = cols >= 0
+            np.add.at(_A, (rows[valid], cols[valid]), K[m])
 
         xp = kwargs.get("xp", pxd.NDArrayInfo.NUMPY.module())
         dtype = kwargs.get("dtype", pxrt.getPrecision().value)
-        A = xp.array(pxu.to_NUMPY(_A), dtype=dtype)
+        A = xp.array(_A, dtype=dtype)
         return A
 
     @pxrt.enforce_precision()
@@ -698,10 +784,12 @@ class Stencil(pxa.SquareOp):
         kern: ~pyxu.operator.linop.stencil.stencil.Stencil.KernelSpec
             Stencil coefficients.
 
-            If the kernel is non-seperable, a single array is returned.
+            If the kernel is non-separable, a single array is returned.
             Otherwise :math:`D` arrays are returned, one per axis.
         """
-        if len(self._st_fw) == 1:
+        if self._factored:  # report kernel as specified at init-time
+            kern = self._kernel_fw
+        elif len(self._st_fw) == 1:
             kern = self._st_fw[0]._kernel
         else:
             kern = [st._kernel for st in self._st_fw]
@@ -748,7 +836,7 @@ class Stencil(pxa.SquareOp):
            )
            S.relative_indices  # [array([-1,  0]), array([0, 1, 2]), array([-3, -2, -1,  0])]
         """
-        if len(self._st_fw) == 1:
+        if (len(self._st_fw) == 1) or self._factored:
             r_idx = [np.arange(s) - c for c, s in zip(self.center, self.kernel.shape)]
         else:
             r_idx = [np.arange(k.size) - c for c, k in zip(self.center, self.kernel)]
@@ -778,8 +866,11 @@ class Stencil(pxa.SquareOp):
                                  #  [4.0 -2.0 (6.0) 2.0]
                                  #  [2.0 -1.0  3.0 1.0]]
         """
-        kernels = [st._kernel for st in self._st_fw]
-        kernel = functools.reduce(operator.mul, kernels, 1)
+        if self._factored:
+            kernel = self._kernel_fw
+        else:
+            kernels = [st._kernel for st in self._st_fw]
+            kernel = functools.reduce(operator.mul, kernels, 1)
 
         kernel = pxu.to_NUMPY(kernel).astype(str)
         kernel[self.center] = "(" + kernel[self.center] + ")"
@@ -885,3 +976,5 @@ class Convolve(Stencil):
 
         # flip FW/BW kernels (& centers)
         self._st_fw, self._st_bw = self._st_bw, self._st_fw
+        self._chain_fw, self._chain_bw = self._chain_bw, self._chain_fw
+        self._kernel_fw, self._kernel_bw = self._kernel_bw, self._kernel_fw
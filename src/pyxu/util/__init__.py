@@ -2,4 +2,5 @@ from pyxu.util.array_module import *
 from pyxu.util.complex import *
 from pyxu.util.inspect import *
 from pyxu.util.misc import *
+from pyxu.util.misc import _isclose
 from pyxu.util.operator import *
@@ -1,4 +1,5 @@
 import collections.abc as cabc
+import math
 
 import pyxu.info.deps as pxd
 import pyxu.info.ptype as pxt
@@ -19,6 +20,15 @@ def as_canonical_shape(x: pxt.NDArrayShape) -> pxt.NDArrayShape:
     return sh
 
 
+def _isclose(a: pxt.Real, b: pxt.Real) -> bool:
+    # Scalar equivalent of np.isclose(a, b), used to detect special constants (0, 1, -1, ...).
+    #
+    # math.isclose() on Python floats avoids the NumPy dispatch of np.isclose().
+    # Tolerances approximate np.isclose() defaults, but are symmetric and combined via max() rather
+    # than summed.
+    return math.isclose(float(a), float(b), rel_tol=1e-5, abs_tol=1e-8)
+
+
 def next_fast_len(N: pxt.Integer, even: bool = False) -> pxt.Integer:
     # Compute the next 5-smooth number greater-or-equal to `N`.
     # If `even=True`, then ensure the next 5-smooth number is even-valued.
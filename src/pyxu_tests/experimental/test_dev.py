@@ -0,0 +1,213 @@
+import itertools
+
+import numpy as np
+import pytest
+
+import pyxu.experimental._dev as pxdev
+import pyxu.info.deps as pxd
+import pyxu.util as pxu
+
+
+class TestFirstDerivative:
+    @pytest.fixture(
+        params=itertools.product(
+            ["forward", "centered", "backward"],
+            [True, False],  # edge
+        )
+    )
+    def op_spec(self, request) -> tuple[str, bool]:
+        return request.param
+
+    @pytest.fixture(
+        params=[
+            ((5, 7), -1),
+            ((5, 7), 0),
+            ((3, 4, 6), 1),
+            ((4, 1), -1),  # singleton differentiation axis
+            ((1, 4), 0),
+        ]
+    )
+    def arr_spec(self, request) -> tuple[tuple[int, ...], int]:
+        return request.param
+
+    @pytest.fixture
+    def op(self, op_spec, arr_spec) -> pxdev.FirstDerivative:
+        kind, edge = op_spec
+        shape, axis = arr_spec
+        return pxdev.FirstDerivative(
+            size=int(np.prod(shape)),
+            axis=axis,
+            sampling=0.5,
+            edge=edge,
+            kind=kind,
+        )
+
+    @pytest.fixture
+    def data(self, arr_spec) -> np.ndarray:
+        shape, _ = arr_spec
+        rng = np.random.default_rng(seed=0)
+        return rng.standard_normal(size=shape)
+
+    @pytest.mark.parametrize("method", ["apply", "adjoint"])
+    def test_backend_equivalence(self, op, data, method):
+        # JIT kernels (NUMPY) and array-API fallbacks (DASK) compute the same thing.
+        da = pxd.NDArrayInfo.DASK.module()
+        f = getattr(op, method)
+
+        out_np = f(data)
+        out_da = f(da.from_array(data, chunks=2))
+        assert pxd.NDArrayInfo.from_obj(out_da) == pxd.NDArrayInfo.DASK
+        assert np.allclose(out_np, pxu.compute(out_da))
+
+    @pytest.mark.parametrize("xp", [np, pxd.NDArrayInfo.DASK.module()])
+    def test_adjoint(self, op, data, xp):
+        # <A x, y> == <x, A^T y>
+        rng = np.random.default_rng(seed=1)
+        x = xp.asarray(data)
+        y = xp.asarray(rng.standard_normal(size=data.shape))
+
+        lhs = pxu.compute((op.apply(x) * y).sum())
+        rhs = pxu.compute((x * op.adjoint(y)).sum())
+        assert np.isclose(lhs, rhs)
+
+    @pytest.mark.parametrize("method", ["apply", "adjoint"])
+    def test_integer_input(self, op, data, method):
+        # Integer inputs are differentiated in floating-point arithmetic.
+        x = np.round(10 * data).astype(np.int64)
+        f = getattr(op, method)
+
+        out = f(x)
+        assert np.issubdtype(out.dtype, np.floating)
+        assert np.allclose(out, f(x.astype(np.float64)))
+
+
+class MaskingMixin:
+    # Masking-like operators are tested against NumPy boolean indexing with their ground-truth
+    # `mask`.
+    @pytest.fixture
+    def op(self) -> pxdev.Masking:
+        raise NotImplementedError
+
+    @pytest.fixture
+    def mask(self) -> np.ndarray:
+        # (size,) boolean mask of retained samples.
+        raise NotImplementedError
+
+    @pytest.fixture(params=[(), (3,), (2, 1)])
+    def stack_shape(self, request) -> tuple[int, ...]:
+        return request.param
+
+    def test_shape(self, op, mask):
+        assert op.shape == (np.count_nonzero(mask), mask.size)
+
+    @pytest.mark.parametrize("xp", [np, pxd.NDArrayInfo.DASK.module()])
+    def test_value_apply(self, op, mask, stack_shape, xp):
+        rng = np.random.default_rng(seed=0)
+        x = rng.standard_normal(size=(*stack_shape, op.dim))
+
+        out = op.apply(xp.asarray(x))
+        assert pxd.NDArrayInfo.from_obj(out) == pxd.NDArrayInfo.from_obj(xp.asarray(x))
+        assert out.shape == (*stack_shape, op.codim)
+        assert np.allclose(pxu.compute(out), x[..., mask])
+
+    @pytest.mark.parametrize("xp", [np, pxd.NDArrayInfo.DASK.module()])
+    def test_value_adjoint(self, op, mask, stack_shape, xp):
+        rng = np.random.default_rng(seed=0)
+        y = rng.standard_normal(size=(*stack_shape, op.codim))
+        out_gt = np.zeros((*stack_shape, op.dim))
+        out_gt[..., mask] = y
+
+        out = op.adjoint(xp.asarray(y))
+        assert pxd.NDArrayInfo.from_obj(out) == pxd.NDArrayInfo.from_obj(xp.asarray(y))
+        assert out.shape[-1] == op.dim
+        assert np.allclose(pxu.compute(out).reshape(out_gt.shape), out_gt)
+
+    def test_adjoint(self, op, stack_shape):
+        # <A x, y> == <x, A^T y>
+        rng = np.random.default_rng(seed=1)
+        x = rng.standard_normal(size=(*stack_shape, op.dim))
+        y = rng.standard_normal(size=(*stack_shape, op.codim))
+
+        lhs = (op.apply(x) * y).sum()
+        rhs = (x * op.adjoint(y).reshape(x.shape)).sum()
+        assert np.isclose(lhs, rhs)
+
+
+class TestMasking(MaskingMixin):
+    @pytest.fixture(
+        params=[
+            np.r_[1, 0, 0, 1, 1, 0, 1].astype(bool),
+            np.r_[0, 0, 0, 0, 0].astype(bool),  # all-False
+            np.r_[1, 1, 1, 1].astype(bool),  # all-True
+            np.r_[0, 2, 0, 1, 0],  # non-boolean
+        ]
+    )
+    def sampling_bool(self, request) -> np.ndarray:
+        return request.param
+
+    @pytest.fixture(params=[True, False])
+    def op(self, sampling_bool, request) -> pxdev.Masking:
+        if request.param:  # list input
+            sampling_bool = sampling_bool.tolist()
+        return pxdev.Masking(size=len(sampling_bool), sampling_bool=sampling_bool)
+
+    @pytest.fixture
+    def mask(self, sampling_bool) -> np.ndarray:
+        return sampling_bool.astype(bool)
+
+
+class TestDownSampling(MaskingMixin):
+    @pytest.fixture(
+        params=[
+            # shape, downsampling_factor, axis
+            ((10,), 3, None),
+            ((12,), 1, None),
+            ((6, 7), 2, None),
+            ((6, 7), (2, 3), None),
+            ((6, 7), 3, 1),
+            ((4, 5, 6), (1, 2, 4), None),
+            ((4, 5, 6), 2, 0),
+        ]
+    )
+    def _spec(self, request) -> tuple:
+        return request.param
+
+    @pytest.fixture(params=[True, False])
+    def op(self, _spec, request) -> pxdev.DownSampling:
+        shape, factor, axis = _spec
+        if request.param:  # 1-D downsampling without shape information
+            if len(shape) > 1:
+                pytest.skip("N-D downsampling requires `shape`.")
+            shape = None
+        return pxdev.DownSampling(
+            size=int(np.prod(_spec[0])),
+            downsampling_factor=factor,
+            shape=shape,
+            axis=axis,
+        )
+
+    @pytest.fixture
+    def mask(self, _spec) -> np.ndarray:
+        shape, factor, axis = _spec
+        if isinstance(factor, int):
+            factor = (factor,) * len(shape)
+        if axis is not None:
+            factor = [1] * len(shape)
+            factor[axis] = _spec[1]
+        idx = np.indices(shape)
+        mask = np.ones(shape, dtype=bool)
+        for d, f in enumerate(factor):
+            mask &= idx[d] % f == 0
+        return mask.reshape(-1)
+
+    def test_downsampling_mask(self, op, mask):
+        assert np.array_equal(op.downsampling_mask, mask)
+        assert np.array_equal(op.sampling_bool, mask)
+
+    def test_output_shape(self, op, _spec, mask):
+        if op.input_shape is None:
+            assert op.output_shape is None
+        else:
+            shape, _, _ = _spec
+            assert int(np.prod(op.output_shape)) == np.count_nonzero(mask)
+            assert len(op.output_shape) == len(shape)
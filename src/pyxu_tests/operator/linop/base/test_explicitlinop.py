@@ -31,6 +31,7 @@ class ExplicitOpMixin:
                     S.SCIPY_SPARSE.module().bsr_matrix,
                     S.SCIPY_SPARSE.module().coo_matrix,
                     S.SCIPY_SPARSE.module().csc_matrix,
+                    S.SCIPY_SPARSE.module().dia_matrix,
                     S.SCIPY_SPARSE.module().csr_matrix,
                     S.PYDATA_SPARSE.module().COO.from_numpy,
                     S.PYDATA_SPARSE.module().GCXS.from_numpy,
@@ -107,6 +108,19 @@ class ExplicitOpMixin:
         # The user is expected to know what he is doing.
         assert op.mat is raw_init_input
 
+    @pytest.mark.parametrize("fmt", ["bsr", "coo", "dia"])
+    def test_value_sparse_format(self, matrix, fmt):
+        # SciPy formats other than CSR/CSC are evaluated via a CSR copy: outputs must match the dense
+        # matrix for stacked inputs.
+        A = pxd.SparseArrayInfo.SCIPY_SPARSE.module().csr_matrix(matrix).asformat(fmt)
+        op = self.base.from_array(A=A)
+
+        M, N = matrix.shape
+        x = self._random_array((3, 2, N), seed=0)
+        y = self._random_array((3, 2, M), seed=1)
+        assert np.allclose(op.apply(x), x @ matrix.T)
+        assert np.allclose(op.adjoint(y), y @ matrix)
+
 
 class TestExplicitLinOp(ExplicitOpMixin, conftest.LinOpT):
     @pytest.fixture
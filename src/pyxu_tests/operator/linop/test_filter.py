@@ -7,8 +7,11 @@ import skimage
 
 import pyxu.info.deps as pxd
 import pyxu.info.ptype as pxt
+import pyxu.info.warning as pxw
 import pyxu.operator.linop.filter as pxf
+import pyxu.operator.linop.stencil as pxls
 import pyxu.runtime as pxrt
+import pyxu.util as pxu
 import pyxu_tests.operator.conftest as conftest
 import pyxu_tests.operator.linop.diff.test_diff as test_diff
 
@@ -56,6 +59,7 @@ class TestMovingAverage(FilterMixin):
             ((5,), 4, (0,), -2),
             ((5, 3, 4), 3, (0, 1, 2), (-1, 0, 1)),
             ((5, 3, 4), (5, 1, 3), None, 0),
+            ((12, 10), (10, 9), (4, 4), (-1, 0)),  # wide windows: prefix-sum evaluation
         ]
     )
     def _spec(self, request):
@@ -98,6 +102,77 @@ class TestMovingAverage(FilterMixin):
         )
 
 
+class TestBoxSum:
+    # _BoxSum() must match the Stencil-based box filter it replaces, for all boundary conditions.
+    @pytest.fixture(
+        params=[
+            # arg_shape, size, center
+            ((13,), (10,), (4,)),
+            ((13,), (9,), (8,)),
+            ((12, 11), (10, 1), (0, 0)),
+            ((12, 11), (9, 10), (4, 9)),
+            ((7, 9, 10), (3, 9, 4), (2, 5, 1)),
+        ]
+    )
+    def _spec(self, request):
+        return request.param
+
+    @pytest.fixture(
+        params=[
+            "constant",
+            "wrap",
+            "reflect",
+            "symmetric",
+            "edge",
+            ("edge", "wrap", "symmetric"),
+        ]
+    )
+    def mode(self, _spec, request):
+        arg_shape, _, _ = _spec
+        mode = request.param
+        if not isinstance(mode, str):
+            mode = mode[: len(arg_shape)]
+        return mode
+
+    @pytest.fixture
+    def ops(self, _spec, mode):
+        arg_shape, size, center = _spec
+        op = pxf._BoxSum(arg_shape=arg_shape, size=size, center=center, mode=mode)
+        op_gt = pxls.Stencil(
+            arg_shape=arg_shape,
+            kernel=[np.ones(s) for s in size],
+            center=center,
+            mode=mode,
+        )
+        return op, op_gt
+
+    @pytest.mark.parametrize("ndi", [pxd.NDArrayInfo.NUMPY, pxd.NDArrayInfo.DASK])
+    @pytest.mark.parametrize("method", ["apply", "adjoint"])
+    def test_value(self, ops, ndi, method):
+        op, op_gt = ops
+        rng = np.random.default_rng(seed=0)
+        x = rng.standard_normal(size=(2, op.dim))
+
+        out_gt = getattr(op_gt, method)(x)
+        if ndi == pxd.NDArrayInfo.DASK:
+            x = ndi.module().from_array(x, chunks=(1, -1))
+        out = pxu.to_NUMPY(getattr(op, method)(x))
+        assert np.allclose(out, out_gt)
+
+    @pytest.mark.parametrize("method", ["apply", "adjoint"])
+    def test_precision(self, _spec, method):
+        # `dtype` sets the working precision, as for Stencil().
+        arg_shape, size, center = _spec
+        op = pxf._BoxSum(arg_shape=arg_shape, size=size, center=center, dtype=np.float32)
+        op_gt = pxf._BoxSum(arg_shape=arg_shape, size=size, center=center, dtype=np.float64)
+        rng = np.random.default_rng(seed=0)
+        x = rng.standard_normal(size=(2, op.dim))
+
+        with pytest.warns(pxw.PrecisionWarning):
+            out = getattr(op, method)(x)
+        assert np.allclose(out, getattr(op_gt, method)(x), atol=1e-4)
+
+
 class TestGaussian(FilterMixin):
     @pytest.fixture
     def filter_klass(self):
@@ -8,6 +8,7 @@ import pyxu.info.deps as pxd
 import pyxu.info.ptype as pxt
 import pyxu.operator.linop as pxl
 import pyxu.runtime as pxrt
+import pyxu.util as pxu
 import pyxu_tests.operator.conftest as conftest
 
 
@@ -80,6 +81,11 @@ class TestStencil(conftest.SquareOpT):
                     ("reflect", "symmetric"),
                 ),
             ),
+            # ND rank-1 (factored internally), random center/mode --
+            (
+                ((10, 11), np.outer(np.arange(1, 4), np.arange(2, 6)), (1, 2), ("wrap", "edge")),
+                ((10, 11), (np.outer(np.arange(1, 4), np.arange(2, 6)),), ((1, 2),), ("wrap", "edge")),
+            ),
         ]
     )
     def _spec(self, request):
@@ -188,6 +194,16 @@ class TestStencil(conftest.SquareOpT):
             out=out.reshape(-1),
         )
 
+    def test_value_kernel(self, _spec, spec):
+        # Non-separable kernels are reported as specified, even if factored internally.
+        op, ndi, width = spec
+        _, kernel, _, _ = _spec[0]  # user-provided form
+        if not isinstance(kernel, np.ndarray):
+            pytest.skip("Only applicable to non-separable kernels.")
+
+        kernel_gt = kernel.astype(width.value)
+        assert np.array_equal(pxu.to_NUMPY(op.kernel), kernel_gt)
+
 
 class TestConvolve:
     # A convolution corresponds to a stencil with reversed kernel/center.